@@ -3,6 +3,75 @@ import polars as pl
 from ..transformers.single.types import RollingStrategy
 
 
+def _rolling_center(
+	expr: pl.Expr,
+	window_size: int,
+	min_samples: int,
+	center: bool,
+	approx: bool,
+) -> pl.Expr:
+	"""
+	Rolling location estimate used for the rolling z-score.
+
+	Args:
+		expr (pl.Expr): The expression to compute the rolling statistic of.
+		window_size (int): The size of the rolling window.
+		min_samples (int): The minimum number of samples required in the window to
+			compute the statistic.
+		center (bool): Whether to set the labels at the center of the window.
+		approx (bool): If True, use the rolling mean instead of the rolling median.
+
+	Returns:
+		pl.Expr: The rolling median, or the rolling mean if approx is True.
+	"""
+
+	if approx:
+		return expr.rolling_mean(window_size, min_samples=min_samples, center=center)
+	return expr.rolling_median(window_size, min_samples=min_samples, center=center)
+
+
+def _rolling_median_mad(
+	col: str,
+	window_size: int,
+	min_samples: int,
+	center: bool,
+	zero_threshold: float,
+	fill_value: float,
+	approx: bool,
+) -> tuple[pl.Expr, pl.Expr]:
+	"""
+	Build the rolling median and MAD expressions of a column.
+
+	Both expressions only depend on the input column, so they can be evaluated in
+	the same projection and share the rolling median subexpression.
+
+	Args:
+		col (str): The name of the column.
+		window_size (int): The size of the rolling window.
+		min_samples (int): The minimum number of samples required in the window to
+			compute the statistics.
+		center (bool): Whether to set the labels at the center of the window.
+		zero_threshold (float): The threshold below which MAD is considered zero.
+		fill_value (float): The value to replace zero MADs with.
+		approx (bool): If True, use rolling mean statistics instead.
+
+	Returns:
+		tuple[pl.Expr, pl.Expr]: The unaliased rolling median and MAD expressions.
+	"""
+
+	median = _rolling_center(pl.col(col), window_size, min_samples, center, approx)
+	mad = _rolling_center(
+		(pl.col(col) - median).abs(), window_size, min_samples, center, approx
+	)
+	mad = (
+		pl.when(mad.is_between(-zero_threshold, zero_threshold))
+		.then(fill_value)
+		.otherwise(mad)
+	)
+
+	return median, mad
+
+
 def zscore(
 	s: pl.Series,
 ) -> pl.Series:
@@ -51,8 +120,11 @@ def zscore_df(
 	med = with_median or "median"
 	std = with_std or "std"
 
+	base_cols = (
+		df.columns if isinstance(df, pl.DataFrame) else df.collect_schema().names()
+	)
 	cols = (
-		df.collect_schema().names()
+		base_cols
 		+ [alias]
 		+ ([with_median] if with_median else [])
 		+ ([with_std] if with_std else [])
@@ -72,6 +144,7 @@ def rolling_zscore(
 	center: bool = False,
 	zero_threshold: float = 1e-5,
 	fill_value: float = 1e-4,
+	approx: bool = False,
 ) -> pl.Series:
 	"""
 	Calculate the rolling z-score of a Polars Series.
@@ -84,6 +157,9 @@ def rolling_zscore(
 		center (bool): Whether to set the labels at the center of the window.
 		zero_threshold (float): The threshold below which MAD is considered zero.
 		fill_value (float): The value to replace zero MADs with.
+		approx (bool): If True, use the rolling mean and the rolling mean absolute
+			deviation instead of the rolling median and MAD. Much cheaper for large
+			windows, at the cost of robustness to outliers.
 
 	Returns:
 		pl.Series: The Series with the rolling z-score values.
@@ -93,31 +169,21 @@ def rolling_zscore(
 	med = "median"
 	col = s.name
 
-	temp_df = (
+	median_expr, mad_expr = _rolling_median_mad(
+		col, window_size, min_samples, center, zero_threshold, fill_value, approx
+	)
+
+	return (
 		s.to_frame()
-		.with_columns(
-			pl.col(col)
-			.rolling_median(window_size, min_samples=min_samples, center=center)
-			.alias(med)
-		)
-		.with_columns(
-			(pl.col(col) - pl.col(med))
-			.abs()
-			.rolling_median(window_size, min_samples=min_samples, center=center)
-			.alias(mad)
-		)
-		.with_columns(
-			pl.when(pl.col(mad).is_between(-zero_threshold, zero_threshold))
-			.then(fill_value)
-			.otherwise(pl.col(mad))
-		)
-		.with_columns(
+		.lazy()
+		.with_columns(median_expr.alias(med), mad_expr.alias(mad))
+		.select(
 			((pl.col(col) - pl.col(med)) / (pl.col(mad) * 1.4826 + 1e-8)).alias(col)
 		)
+		.collect()
+		.to_series()
 	)
 
-	return temp_df.select(pl.col(col)).to_series()
-
 
 def rolling_zscore_df(
 	df: pl.DataFrame | pl.LazyFrame,
@@ -130,6 +196,7 @@ def rolling_zscore_df(
 	alias: str = "z_score",
 	with_median: str | None = None,
 	with_mad: str | None = None,
+	approx: bool = False,
 ) -> pl.DataFrame | pl.LazyFrame:
 	"""
 	Calculate the rolling z-score of a Polars Series col. Can ret
@@ -148,37 +215,34 @@ def rolling_zscore_df(
 			this name in the output.
 		with_mad (str | None): If provided, include the rolling MAD column with this
 			name in the output.
+		approx (bool): If True, use the rolling mean and the rolling mean absolute
+			deviation instead of the rolling median and MAD. Much cheaper for large
+			windows, at the cost of robustness to outliers.
 
 	Returns:
 		pl.DataFrame | pl.LazyFrame: The DataFrame with the rolling z-score column
 			added.
 	"""
 
-	mad = "mad"
+	base_cols = (
+		df.columns if isinstance(df, pl.DataFrame) else df.collect_schema().names()
+	)
 	cols = (
-		df.collect_schema().names()
+		base_cols
 		+ [alias]
 		+ ([with_median] if with_median else [])
 		+ ([with_mad] if with_mad else [])
 	)
 	with_median = with_median if with_median else RollingStrategy.MEDIAN
-	return (
-		df.with_columns(
-			pl.col(col)
-			.rolling_median(window_size, min_samples=min_samples, center=center)
-			.alias(with_median)
-		)
-		.with_columns(
-			(pl.col(col) - pl.col(with_median))
-			.abs()
-			.rolling_median(window_size, min_samples=min_samples, center=center)
-			.alias(mad)
-		)
-		.with_columns(
-			pl.when(pl.col(mad).is_between(-zero_threshold, zero_threshold))
-			.then(fill_value)
-			.otherwise(pl.col(mad))
-		)
+	mad = with_mad if with_mad else "mad"
+
+	median_expr, mad_expr = _rolling_median_mad(
+		col, window_size, min_samples, center, zero_threshold, fill_value, approx
+	)
+
+	result = (
+		df.lazy()
+		.with_columns(median_expr.alias(with_median), mad_expr.alias(mad))
 		.with_columns(
 			((pl.col(col) - pl.col(with_median)) / (pl.col(mad) * 1.4826 + 1e-8)).alias(
 				alias
@@ -186,3 +250,5 @@ def rolling_zscore_df(
 		)
 		.select(cols)
 	)
+
+	return result.collect() if isinstance(df, pl.DataFrame) else result
@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 from dataclasses import dataclass
 from typing import Self, cast
@@ -6,7 +7,7 @@ import polars as pl
 import polars.selectors as cs
 from polars._typing import PolarsDataType
 
-from ..single import BaseColumnTransformer
+from ..single import BaseColumnTransformer, ExprTransformerMixin
 from .base import BaseMultiColumnTransformer
 
 
@@ -97,16 +98,57 @@ class MultiColumnTransformer(BaseMultiColumnTransformer):
 
 		cols = df.collect_schema().names()
 
-		df = df.with_columns(cs.numeric().cast(pl.Float64)).with_columns(
-			[
-				pl.col(col)
-				.map_batches(tf.transform, return_dtype=pl.self_dtype())
-				.alias(col)
-				for col, tf in self.col_to_transformer.items()
-			]
-		)
+		lf = df.lazy().with_columns(cs.numeric().cast(pl.Float64))
+		schema = lf.collect_schema()
+		batch_cols: list[str] = []
+		exprs: list[pl.Expr] = []
+		for col, tf in self.col_to_transformer.items():
+			if isinstance(tf, ExprTransformerMixin):
+				exprs.append(tf._transform_expr(col, schema[col]).alias(col))
+			else:
+				batch_cols.append(col)
+
+		# Transformers expressible as Polars expressions go into a single
+		# with_columns so that Polars can parallelize across columns
+		if exprs:
+			lf = lf.with_columns(exprs)
+
+		if len(batch_cols) > 1 and pl.thread_pool_size() > 1:
+			# Evaluate the struct into one temporary column: .struct.unnest() inside
+			# with_columns would run the UDF once per field
+			tmp = "__batch__"
+			while tmp in cols:
+				tmp = f"_{tmp}"
+			lf = (
+				lf.with_columns(
+					pl.struct(batch_cols)
+					.map_batches(
+						self._transform_parallel,
+						return_dtype=pl.Struct(
+							{col: schema[col] for col in batch_cols}
+						),
+					)
+					.alias(tmp)
+				)
+				.drop(batch_cols)
+				.unnest(tmp)
+			)
+		elif batch_cols:
+			lf = lf.with_columns(
+				[
+					pl.col(col)
+					.map_batches(
+						self.col_to_transformer[col].transform,
+						return_dtype=pl.self_dtype(),
+					)
+					.alias(col)
+					for col in batch_cols
+				]
+			)
+
+		lf = lf.select(cols)
 
-		return df.select(cols)
+		return lf.collect() if isinstance(df, pl.DataFrame) else lf
 
 	def fit_transform(
 		self, df: pl.DataFrame | pl.LazyFrame
@@ -124,6 +166,36 @@ class MultiColumnTransformer(BaseMultiColumnTransformer):
 
 		return self.fit(df).transform(df)
 
+	def _transform_parallel(self, s: pl.Series) -> pl.Series:
+		"""
+		Transform each field of a struct series with its transformer in a thread pool.
+
+		Polars releases the GIL while evaluating, so transformers of different columns
+		can run concurrently instead of one map_batches call after another.
+
+		Args:
+			s (pl.Series): The struct series holding the columns to transform.
+
+		Returns:
+			pl.Series: The struct series holding the transformed columns.
+		"""
+
+		df = s.struct.unnest()
+		# Bounded by the Polars pool so POLARS_MAX_THREADS also caps these threads
+		with ThreadPoolExecutor(
+			max_workers=min(df.width, pl.thread_pool_size())
+		) as executor:
+			futures = {
+				col: executor.submit(
+					self.col_to_transformer[col].transform, df.get_column(col)
+				)
+				for col in df.columns
+			}
+
+		return pl.DataFrame(
+			[future.result().alias(col) for col, future in futures.items()]
+		).to_struct(s.name)
+
 	def get_transformer(self, col: str) -> BaseColumnTransformer | None:
 		"""
 		Gets the transformer associated with a specific column.
@@ -22,7 +22,7 @@ class Pipeline(BaseMultiColumnTransformer):
 
 	@override
 	def fit(self, df: pl.DataFrame | pl.LazyFrame) -> Self:
-		df = df.lazy().collect()
+		df = df.rechunk() if isinstance(df, pl.DataFrame) else df.collect()
 		for step in self.steps:
 			df = step.transformer.fit_transform(df)
 
@@ -41,6 +41,8 @@ class Pipeline(BaseMultiColumnTransformer):
 				f"{self.__class__.__name__} must be fitted before calling transform."
 			)
 
+		lf = df.lazy()
 		for step in self.steps:
-			df = step.transformer.transform(df)
-		return df
+			lf = step.transformer.transform(lf)
+
+		return lf.collect() if isinstance(df, pl.DataFrame) else lf  # type: ignore
@@ -1,4 +1,4 @@
-from .base import BaseColumnTransformer, InverseTransformerMixin
+from .base import BaseColumnTransformer, ExprTransformerMixin, InverseTransformerMixin
 from .difference import DiffTransformer
 from .impute import Imputer, RollingImputer
 from .lag import LagTransformer
@@ -20,4 +20,5 @@ __all__ = [
 	"LagTransformer",
 	"DiffTransformer",
 	"InverseTransformerMixin",
+	"ExprTransformerMixin",
 ]
@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 from typing import Self
 
 import polars as pl
+from polars._typing import PolarsDataType, PythonLiteral
 
 
 class BaseColumnTransformer(ABC):
@@ -73,3 +74,99 @@ class InverseTransformerMixin(ABC):
 		"""
 
 		...
+
+
+class ExprTransformerMixin(ABC):
+	"""Base class for transformers that can be expressed as a Polars expression."""
+
+	is_fitted: bool
+
+	@abstractmethod
+	def _transform_expr(self, col: str, dtype: PolarsDataType) -> pl.Expr:
+		"""
+		Build the expression transforming a single column.
+
+		Args:
+			col (str): The name of the column to transform.
+			dtype (PolarsDataType): The dtype of the column.
+
+		Returns:
+			pl.Expr: The expression producing the transformed column.
+		"""
+
+		...
+
+	def transform_many(self, df: pl.LazyFrame, cols: list[str]) -> pl.LazyFrame:
+		"""
+		Transform several columns with the fitted transformer in a single projection.
+
+		All columns are transformed using the same fitted statistics, letting Polars
+		evaluate them in parallel within one query.
+
+		Args:
+			df (pl.LazyFrame): The input LazyFrame.
+			cols (list[str]): The names of the columns to transform.
+
+		Returns:
+			pl.LazyFrame: The LazyFrame with the columns transformed.
+		"""
+
+		if not self.is_fitted:
+			raise ValueError(f"{self.__class__.__name__} has not been fitted yet.")
+
+		schema = df.collect_schema()
+
+		return df.with_columns(
+			[self._transform_expr(col, schema[col]).alias(col) for col in cols]
+		)
+
+
+def _fitted_dtype(dtype: PolarsDataType) -> PolarsDataType:
+	"""
+	Get the dtype fitted statistics are stored as for a series of the given dtype.
+
+	Float statistics keep the dtype of the fitted series so that arithmetic against
+	e.g. a Float32 column does not widen to Float64. Any other dtype falls back to
+	Float64, since statistics like the mean of an integer series are fractional.
+
+	Args:
+		dtype (PolarsDataType): The dtype of the series the statistic was fitted on.
+
+	Returns:
+		PolarsDataType: The dtype of the fitted statistic.
+	"""
+
+	return dtype if dtype.is_float() else pl.Float64
+
+
+def _fitted_lit(value: PythonLiteral, dtype: PolarsDataType) -> pl.Expr:
+	"""
+	Wrap a fitted statistic as a literal expression of its fitted dtype.
+
+	Args:
+		value (PythonLiteral): The fitted statistic.
+		dtype (PolarsDataType): The dtype of the series the statistic was fitted on.
+
+	Returns:
+		pl.Expr: The literal expression.
+	"""
+
+	return pl.lit(value, dtype=_fitted_dtype(dtype))
+
+
+def _maybe_cast[T: (pl.Expr, pl.Series)](
+	obj: T, from_dtype: PolarsDataType, to_dtype: PolarsDataType
+) -> T:
+	"""
+	Cast an expression or series, skipping the cast if the dtype already matches.
+
+	Args:
+		obj (pl.Expr | pl.Series): The expression or series to cast.
+		from_dtype (PolarsDataType): The dtype obj currently evaluates to.
+		to_dtype (PolarsDataType): The target dtype.
+
+	Returns:
+		pl.Expr | pl.Series: obj, cast to to_dtype if the dtypes differ.
+	"""
+
+	return obj if from_dtype == to_dtype else obj.cast(to_dtype)
@@ -1,9 +1,14 @@
+from math import comb
 from typing import Self, override
 
 import polars as pl
 
 from .base import BaseColumnTransformer
 
+# Highest order evaluated via binomial coefficients in a single pass; above this
+# the coefficients grow large enough to hurt floating point accuracy.
+_MAX_CLOSED_FORM_ORDER = 3
+
 
 class DiffTransformer(BaseColumnTransformer):
 	"""
@@ -40,6 +45,7 @@ class DiffTransformer(BaseColumnTransformer):
 		self.order = order
 		self.periods = periods
 		self._initial_values: list[pl.Series] = []
+		self._coeffs = [(-1) ** k * comb(order, k) for k in range(order + 1)]
 		super().__init__()
 
 	@override
@@ -79,6 +85,13 @@ class DiffTransformer(BaseColumnTransformer):
 		if not self.is_fitted:
 			raise ValueError(f"{self.__class__.__name__} has not been fitted yet.")
 
+		if 1 < self.order <= _MAX_CLOSED_FORM_ORDER and s.dtype.is_float():
+			# x[t] - C(d, 1) * x[t - p] + C(d, 2) * x[t - 2p] - ...
+			expr = pl.col(s.name)
+			for k, coeff in enumerate(self._coeffs[1:], start=1):
+				expr = expr + coeff * pl.col(s.name).shift(k * self.periods)
+			return s.to_frame().lazy().select(expr.alias(s.name)).collect().to_series()
+
 		result = s
 		for _ in range(self.order):
 			result = result.diff(n=self.periods)
@@ -1,13 +1,21 @@
 from typing import Any, Self, override
 
 import polars as pl
-from polars._typing import PythonLiteral
+from polars._typing import PolarsDataType, PythonLiteral
 
-from .base import BaseColumnTransformer
+from .base import BaseColumnTransformer, ExprTransformerMixin, _maybe_cast
 from .types import RollingStrategy, Strategy
 
+_FILL_STRATS = frozenset({Strategy.FORWARD, Strategy.BACKWARD})
+_AGG_EXPRS = {
+	Strategy.MEDIAN: pl.all().median(),
+	Strategy.MEAN: pl.all().mean(),
+	Strategy.MIN: pl.all().min(),
+	Strategy.MAX: pl.all().max(),
+}
 
-class Imputer(BaseColumnTransformer):
+
+class Imputer(BaseColumnTransformer, ExprTransformerMixin):
 	"""
 	Simple imputer for handling missing values in a Polars Series.
 
@@ -45,14 +53,18 @@ class Imputer(BaseColumnTransformer):
 		match self.strategy:
 			case None | Strategy.FORWARD | Strategy.BACKWARD:
 				self.fitted_value = None
-			case Strategy.MEDIAN:
-				self.fitted_value = s.median()
-			case Strategy.MEAN:
-				self.fitted_value = s.mean()
-			case Strategy.MIN:
-				self.fitted_value = s.min()
-			case Strategy.MAX:
-				self.fitted_value = s.max()
+			case Strategy.MEDIAN | Strategy.MEAN | Strategy.MIN | Strategy.MAX:
+				try:
+					self.fitted_value = (
+						s.to_frame()
+						.lazy()
+						.select(_AGG_EXPRS[self.strategy])
+						.collect()
+						.item()
+					)
+				except pl.exceptions.InvalidOperationError:
+					# Unsupported dtype, e.g. the mean of a String series
+					self.fitted_value = None
 			case Strategy.ZERO:
 				if s.dtype == pl.String or s.dtype == pl.Categorical:
 					self.fitted_value = "0"
@@ -64,17 +76,12 @@ class Imputer(BaseColumnTransformer):
 				else:
 					self.fitted_value = 1
 
+		needs_fit = self.strategy is not None and self.strategy not in _FILL_STRATS
 		self.is_fitted = any(
 			[
-				(
-					self.fitted_value is None
-					and self.strategy in [Strategy.FORWARD, Strategy.BACKWARD, None]
-				),
+				(self.fitted_value is None and not needs_fit),
 				(self.value is not None),
-				(
-					self.fitted_value is not None
-					and self.strategy not in [Strategy.FORWARD, Strategy.BACKWARD, None]
-				),
+				(self.fitted_value is not None and needs_fit),
 			]
 		)
 		if not self.is_fitted:
@@ -91,22 +98,26 @@ class Imputer(BaseColumnTransformer):
 			raise ValueError(f"{self.__class__.__name__} has not been fitted yet.")
 
 		if self.value is not None:
-			fill_val = self.value
-			temp_df = s.to_frame().with_columns(
-				pl.col(s.name).fill_null(value=fill_val)
-			)
-		elif self.strategy in [Strategy.FORWARD, Strategy.BACKWARD]:
-			temp_df = s.to_frame().with_columns(
-				pl.col(s.name).fill_null(strategy=self.strategy)  # type: ignore
-			)
+			result = s.fill_null(value=self.value)
+		elif self.strategy in _FILL_STRATS:
+			result = s.fill_null(strategy=self.strategy)  # type: ignore
 		else:
 			if self.fitted_value is None:
 				raise ValueError(f"{self.__class__.__name__} has not been fitted yet.")
-			temp_df = s.to_frame().with_columns(
-				pl.col(s.name).fill_null(value=self.fitted_value)
-			)
+			result = s.fill_null(value=self.fitted_value)
+
+		return _maybe_cast(result, result.dtype, s.dtype)
 
-		return temp_df.select(pl.col(s.name).cast(s.dtype)).to_series()
+	@override
+	def _transform_expr(self, col: str, dtype: PolarsDataType) -> pl.Expr:
+		if self.value is not None:
+			return pl.col(col).fill_null(value=self.value).cast(dtype)
+		elif self.strategy in _FILL_STRATS:
+			return pl.col(col).fill_null(strategy=self.strategy)  # type: ignore
+		else:
+			if self.fitted_value is None:
+				raise ValueError(f"{self.__class__.__name__} has not been fitted yet.")
+			return pl.col(col).fill_null(value=self.fitted_value).cast(dtype)
 
 
 class RollingImputer(BaseColumnTransformer):
@@ -123,6 +134,8 @@ class RollingImputer(BaseColumnTransformer):
 			to compute the statistic.
 			If None, it defaults to window_size.
 		center (bool): Whether to set the labels at the center of the window.
+		interpolate (bool): Whether to linearly interpolate values the rolling
+			statistic could not fill before falling back to forward fill.
 	"""
 
 	def __init__(
@@ -132,12 +145,14 @@ class RollingImputer(BaseColumnTransformer):
 		min_samples: int = 1,
 		weights: list[float] | None = None,
 		center: bool = False,
+		interpolate: bool = False,
 	):
 		self.strategy = strategy
 		self.window_size = window_size
 		self.weights = weights
 		self.min_samples = min_samples or window_size
 		self.center = center
+		self.interpolate = interpolate
 		self.is_fitted = True
 
 	@override
@@ -164,50 +179,68 @@ class RollingImputer(BaseColumnTransformer):
 		stat = "stat"
 		match self.strategy:
 			case RollingStrategy.MIN:
-				temp_df = pl.LazyFrame({s.name: s}).with_columns(
-					pl.col(s.name)
-					.rolling_min(
-						self.window_size,
-						min_samples=self.min_samples,
-						center=self.center,
+				temp_df = (
+					s.to_frame()
+					.lazy()
+					.with_columns(
+						pl.col(s.name)
+						.rolling_min(
+							self.window_size,
+							min_samples=self.min_samples,
+							center=self.center,
+						)
+						.alias(stat)
 					)
-					.alias(stat)
 				)
 			case RollingStrategy.MAX:
-				temp_df = pl.LazyFrame({s.name: s}).with_columns(
-					pl.col(s.name)
-					.rolling_max(
-						self.window_size,
-						min_samples=self.min_samples,
-						center=self.center,
+				temp_df = (
+					s.to_frame()
+					.lazy()
+					.with_columns(
+						pl.col(s.name)
+						.rolling_max(
+							self.window_size,
+							min_samples=self.min_samples,
+							center=self.center,
+						)
+						.alias(stat)
 					)
-					.alias(stat)
 				)
 			case RollingStrategy.MEAN:
-				temp_df = pl.LazyFrame({s.name: s}).with_columns(
-					pl.col(s.name)
-					.rolling_mean(
-						self.window_size,
-						min_samples=self.min_samples,
-						center=self.center,
+				temp_df = (
+					s.to_frame()
+					.lazy()
+					.with_columns(
+						pl.col(s.name)
+						.rolling_mean(
+							self.window_size,
+							min_samples=self.min_samples,
+							center=self.center,
+						)
+						.alias(stat)
 					)
-					.alias(stat)
 				)
 			case RollingStrategy.MEDIAN:
-				temp_df = pl.LazyFrame({s.name: s}).with_columns(
-					pl.col(s.name)
-					.rolling_median(
-						self.window_size,
-						min_samples=self.min_samples,
-						center=self.center,
+				temp_df = (
+					s.to_frame()
+					.lazy()
+					.with_columns(
+						pl.col(s.name)
+						.rolling_median(
+							self.window_size,
+							min_samples=self.min_samples,
+							center=self.center,
+						)
+						.alias(stat)
 					)
-					.alias(stat)
 				)
 
+		filled = pl.coalesce(pl.col(s.name), pl.col(stat))
+		if self.interpolate:
+			filled = filled.interpolate("linear")
+
 		temp_df = temp_df.with_columns(
-			pl.coalesce(pl.col(s.name), pl.col(stat))
-			.interpolate("linear")
-			.fill_null(strategy="forward")
+			filled.fill_null(strategy="forward")
 			.fill_null(0)
 			.cast(s.dtype)
 			.alias(s.name)
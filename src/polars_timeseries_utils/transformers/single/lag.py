@@ -76,3 +76,27 @@ class LagTransformer(BaseColumnTransformer):
 			result = result.fill_null(self.fill_value)
 
 		return result
+
+	def transform_multi(self, s: pl.Series) -> pl.DataFrame:
+		"""
+		Transform the series by applying all configured lags at once.
+
+		Args:
+			s (pl.Series): The input series to transform.
+
+		Returns:
+			pl.DataFrame: A DataFrame with one column per lag, named
+				'{name}_lag{lag}'.
+		"""
+
+		if not self.is_fitted:
+			raise ValueError(f"{self.__class__.__name__} has not been fitted yet.")
+
+		lag_exprs = []
+		for lag in self.lags:
+			expr = pl.col(s.name).shift(lag)
+			if self.fill_value is not None:
+				expr = expr.fill_null(self.fill_value)
+			lag_exprs.append(expr.alias(f"{s.name}_lag{lag}"))
+
+		return s.to_frame().lazy().select(lag_exprs).collect()
@@ -1,12 +1,21 @@
 from typing import Self, override
 
 import polars as pl
-from polars._typing import PythonLiteral
+from polars._typing import PolarsDataType, PythonLiteral
 
-from .base import BaseColumnTransformer, InverseTransformerMixin
+from .base import (
+	BaseColumnTransformer,
+	ExprTransformerMixin,
+	InverseTransformerMixin,
+	_fitted_dtype,
+	_fitted_lit,
+	_maybe_cast,
+)
 
 
-class MinMaxScaler(BaseColumnTransformer, InverseTransformerMixin):
+class MinMaxScaler(
+	BaseColumnTransformer, InverseTransformerMixin, ExprTransformerMixin
+):
 	"""
 	Scales a Polars Series to a given range [0, 1] using Min-Max scaling.
 
@@ -22,12 +31,20 @@ class MinMaxScaler(BaseColumnTransformer, InverseTransformerMixin):
 
 		self.min: PythonLiteral | None = None
 		self.max: PythonLiteral | None = None
+		self._fitted_dtype: PolarsDataType | None = None
 		super().__init__()
 
 	@override
 	def fit(self, s: pl.Series) -> Self:
-		self.min = s.min()
-		self.max = s.max()
+		self.min, self.max = (
+			s.to_frame()
+			.lazy()
+			.select(
+				pl.col(s.name).min().alias("min"), pl.col(s.name).max().alias("max")
+			)
+			.collect()
+			.row(0)
+		)
 
 		self.is_fitted = self.min is not None and self.max is not None
 		if not self.is_fitted:
@@ -36,6 +53,8 @@ class MinMaxScaler(BaseColumnTransformer, InverseTransformerMixin):
 				" max values."
 			)
 
+		self._fitted_dtype = _fitted_dtype(s.dtype)
+
 		return self
 
 	@override
@@ -43,15 +62,62 @@ class MinMaxScaler(BaseColumnTransformer, InverseTransformerMixin):
 		if not self.is_fitted:
 			raise ValueError(f"{self.__class__.__name__} has not been fitted yet.")
 
-		temp_df = s.to_frame().with_columns(
-			pl.when(pl.col(s.name).is_null())
+		if s.dtype == self._fitted_dtype and not s.has_nulls():
+			return self._transform_numpy(s)
+
+		return (
+			s.to_frame()
+			.lazy()
+			.select(self._transform_expr(s.name, s.dtype).alias(s.name))
+			.collect()
+			.to_series()
+		)
+
+	def _transform_numpy(self, s: pl.Series) -> pl.Series:
+		"""
+		Min-max scale a null-free series of the fitted dtype with NumPy.
+
+		Without nulls there is nothing to mask, so the scaling is a single
+		vectorized expression on the series buffer. The fitted min and max are
+		converted to the series dtype first so that Float32 input stays Float32.
+
+		Args:
+			s (pl.Series): The float series without nulls to transform.
+
+		Returns:
+			pl.Series: The scaled series.
+		"""
+
+		x = s.to_numpy()
+		min_, max_ = x.dtype.type(self.min), x.dtype.type(self.max)
+		out = (x - min_) / (max_ - min_ + x.dtype.type(1e-8))
+
+		return pl.Series(s.name, out, dtype=s.dtype)
+
+	@override
+	def _transform_expr(self, col: str, dtype: PolarsDataType) -> pl.Expr:
+		# Evaluates to the fitted dtype when it matches the input dtype
+		min_, max_ = self._fitted_lits()
+		expr = (
+			pl.when(pl.col(col).is_null())
 			.then(None)
-			.otherwise((pl.col(s.name) - self.min) / (self.max - self.min + 1e-8))  # type: ignore
-			.cast(s.dtype)
-			.alias(s.name)
+			.otherwise((pl.col(col) - min_) / (max_ - min_ + 1e-8))
 		)
 
-		return temp_df.select(s.name).to_series()
+		return _maybe_cast(expr, self._fitted_dtype, dtype)  # type: ignore
+
+	def _fitted_lits(self) -> tuple[pl.Expr, pl.Expr]:
+		"""
+		Wrap the fitted min and max as literals of the fitted dtype.
+
+		Returns:
+			tuple[pl.Expr, pl.Expr]: The min and max literal expressions.
+		"""
+
+		return (
+			_fitted_lit(self.min, self._fitted_dtype),  # type: ignore
+			_fitted_lit(self.max, self._fitted_dtype),  # type: ignore
+		)
 
 	@override
 	def inverse_transform(self, s: pl.Series) -> pl.Series:
@@ -68,18 +134,25 @@ class MinMaxScaler(BaseColumnTransformer, InverseTransformerMixin):
 		if not self.is_fitted:
 			raise ValueError(f"{self.__class__.__name__} has not been fitted yet.")
 
-		temp_df = s.to_frame().with_columns(
+		min_, max_ = self._fitted_lits()
+		expr = (
 			pl.when(pl.col(s.name).is_null())
 			.then(None)
-			.otherwise(pl.col(s.name) * (self.max - self.min + 1e-8) + self.min)  # type: ignore
-			.cast(s.dtype)
-			.alias(s.name)
+			.otherwise(pl.col(s.name) * (max_ - min_ + 1e-8) + min_)
 		)
 
-		return temp_df.select(s.name).to_series()
+		return (
+			s.to_frame()
+			.lazy()
+			.select(_maybe_cast(expr, self._fitted_dtype, s.dtype).alias(s.name))  # type: ignore
+			.collect()
+			.to_series()
+		)
 
 
-class StandardScaler(BaseColumnTransformer, InverseTransformerMixin):
+class StandardScaler(
+	BaseColumnTransformer, InverseTransformerMixin, ExprTransformerMixin
+):
 	"""
 	Scales a Polars Series to have zero mean and unit variance using Standard scaling.
 	"""
@@ -95,8 +168,15 @@ class StandardScaler(BaseColumnTransformer, InverseTransformerMixin):
 
 	@override
 	def fit(self, s: pl.Series) -> Self:
-		self.mean = s.mean()
-		self.std = s.std()
+		self.mean, self.std = (
+			s.to_frame()
+			.lazy()
+			.select(
+				pl.col(s.name).mean().alias("mean"), pl.col(s.name).std().alias("std")
+			)
+			.collect()
+			.row(0)
+		)
 
 		self.is_fitted = self.mean is not None and self.std is not None
 		if not self.is_fitted:
@@ -112,10 +192,14 @@ class StandardScaler(BaseColumnTransformer, InverseTransformerMixin):
 		if not self.is_fitted:
 			raise ValueError(f"{self.__class__.__name__} has not been fitted yet.")
 
-		temp_df = s.to_frame().with_columns(
-			((pl.col(s.name) - self.mean) / self.std).cast(s.dtype).alias(s.name)
-		)
-		return temp_df.select(s.name).to_series()
+		result = (s - self.mean) / self.std  # type: ignore
+		return _maybe_cast(result, result.dtype, s.dtype).alias(s.name)
+
+	@override
+	def _transform_expr(self, col: str, dtype: PolarsDataType) -> pl.Expr:
+		# Python scalars are dynamic literals, so float columns keep their dtype
+		expr = (pl.col(col) - self.mean) / self.std  # type: ignore
+		return _maybe_cast(expr, _fitted_dtype(dtype), dtype)
 
 	@override
 	def inverse_transform(self, s: pl.Series) -> pl.Series:
@@ -132,10 +216,8 @@ class StandardScaler(BaseColumnTransformer, InverseTransformerMixin):
 		if not self.is_fitted:
 			raise ValueError(f"{self.__class__.__name__} has not been fitted yet.")
 
-		temp_df = s.to_frame().with_columns(
-			(pl.col(s.name) * self.std + self.mean).cast(s.dtype).alias(s.name)
-		)
-		return temp_df.select(s.name).to_series()
+		result = s * self.std + self.mean  # type: ignore
+		return _maybe_cast(result, result.dtype, s.dtype).alias(s.name)
 
 
 class RobustScaler(BaseColumnTransformer, InverseTransformerMixin):
@@ -175,9 +257,17 @@ class RobustScaler(BaseColumnTransformer, InverseTransformerMixin):
 
 	@override
 	def fit(self, s: pl.Series) -> Self:
-		self.median = s.median()
-		self.q_min_val = s.quantile(self.q_min)
-		self.q_max_val = s.quantile(self.q_max)
+		self.median, self.q_min_val, self.q_max_val = (
+			s.to_frame()
+			.lazy()
+			.select(
+				pl.col(s.name).median().alias("median"),
+				pl.col(s.name).quantile(self.q_min).alias("q_min"),
+				pl.col(s.name).quantile(self.q_max).alias("q_max"),
+			)
+			.collect()
+			.row(0)
+		)
 
 		if self.q_min_val is not None and self.q_max_val is not None:
 			self.iqr = self.q_max_val - self.q_min_val  # type: ignore
@@ -198,16 +288,20 @@ class RobustScaler(BaseColumnTransformer, InverseTransformerMixin):
 		if not self.is_fitted:
 			raise ValueError(f"{self.__class__.__name__} has not been fitted yet.")
 
-		temp_df = s.to_frame().with_columns(
-			pl.when(pl.col(s.name).is_null())
-			.then(None)
-			.otherwise((pl.col(s.name) - self.median) / (self.iqr + 1e-8))  # type: ignore
-			.cast(s.dtype)
-			.alias(s.name)
+		return (
+			s.to_frame()
+			.lazy()
+			.select(
+				pl.when(pl.col(s.name).is_null())
+				.then(None)
+				.otherwise((pl.col(s.name) - self.median) / (self.iqr + 1e-8))  # type: ignore
+				.cast(s.dtype)
+				.alias(s.name)
+			)
+			.collect()
+			.to_series()
 		)
 
-		return temp_df.select(s.name).to_series()
-
 	@override
 	def inverse_transform(self, s: pl.Series) -> pl.Series:
 		"""
@@ -223,12 +317,16 @@ class RobustScaler(BaseColumnTransformer, InverseTransformerMixin):
 		if not self.is_fitted:
 			raise ValueError(f"{self.__class__.__name__} has not been fitted yet.")
 
-		temp_df = s.to_frame().with_columns(
-			pl.when(pl.col(s.name).is_null())
-			.then(None)
-			.otherwise(pl.col(s.name) * (self.iqr + 1e-8) + self.median)  # type: ignore
-			.cast(s.dtype)
-			.alias(s.name)
+		return (
+			s.to_frame()
+			.lazy()
+			.select(
+				pl.when(pl.col(s.name).is_null())
+				.then(None)
+				.otherwise(pl.col(s.name) * (self.iqr + 1e-8) + self.median)  # type: ignore
+				.cast(s.dtype)
+				.alias(s.name)
+			)
+			.collect()
+			.to_series()
 		)
-
-		return temp_df.select(s.name).to_series()
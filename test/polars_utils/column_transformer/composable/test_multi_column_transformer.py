@@ -1,3 +1,7 @@
+from collections import Counter
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+
 import polars as pl
 import polars.selectors as cs
 import pytest
@@ -6,23 +10,31 @@ from polars_timeseries_utils.transformers.composable import (
 	ColumnTransformerMetadata,
 	MultiColumnTransformer,
 )
-from polars_timeseries_utils.transformers.single import Imputer
-from polars_timeseries_utils.transformers.single.types import Strategy
+from polars_timeseries_utils.transformers.single import Imputer, RollingImputer
+
+
+@pytest.fixture(scope="module")
+def fitted_mct(
+	df_multi_column: pl.DataFrame, mct_factory: Callable[..., MultiColumnTransformer]
+) -> MultiColumnTransformer:
+	"""MultiColumnTransformer mean-imputing col_a and col_b, fitted once."""
+	return mct_factory().fit(df_multi_column)
+
+
+@pytest.fixture(scope="module")
+def transformed_df(
+	df_multi_column: pl.DataFrame, fitted_mct: MultiColumnTransformer
+) -> pl.DataFrame:
+	"""df_multi_column transformed by fitted_mct."""
+	return fitted_mct.transform(df_multi_column)  # type: ignore
 
 
 class TestMultiColumnTransformer:
 	"""Tests for the MultiColumnTransformer class."""
 
-	def test_init(self) -> None:
+	def test_init(self, mct_factory: Callable[..., MultiColumnTransformer]) -> None:
 		"""Test initialization."""
-		transformers = [
-			ColumnTransformerMetadata(
-				name="imputer",
-				columns=["col_a", "col_b"],
-				transformer=Imputer(strategy=Strategy.MEAN),
-			)
-		]
-		mct = MultiColumnTransformer(transformers)
+		mct = mct_factory()
 
 		assert len(mct.transformers) == 1
 		assert mct.is_fitted is False
@@ -36,105 +48,58 @@ class TestMultiColumnTransformer:
 		):
 			MultiColumnTransformer([])
 
-	def test_fit(self, df_multi_column: pl.DataFrame) -> None:
+	def test_fit(self, fitted_mct: MultiColumnTransformer) -> None:
 		"""Test fitting the transformer."""
-		transformers = [
-			ColumnTransformerMetadata(
-				name="imputer",
-				columns=["col_a", "col_b"],
-				transformer=Imputer(strategy=Strategy.MEAN),
-			)
-		]
-		mct = MultiColumnTransformer(transformers)
-		mct.fit(df_multi_column)
-
-		assert mct.is_fitted is True
-		assert len(mct.col_to_transformer) == 2
-		assert "col_a" in mct.col_to_transformer
-		assert "col_b" in mct.col_to_transformer
+		assert fitted_mct.is_fitted is True
+		assert len(fitted_mct.col_to_transformer) == 2
+		assert "col_a" in fitted_mct.col_to_transformer
+		assert "col_b" in fitted_mct.col_to_transformer
 
-	def test_transform_fills_nulls(self, df_multi_column: pl.DataFrame) -> None:
+	def test_transform_fills_nulls(self, transformed_df: pl.DataFrame) -> None:
 		"""Test that transform fills nulls in specified columns."""
-		transformers = [
-			ColumnTransformerMetadata(
-				name="imputer",
-				columns=["col_a", "col_b"],
-				transformer=Imputer(strategy=Strategy.MEAN),
-			)
-		]
-		mct = MultiColumnTransformer(transformers)
-		result = mct.fit_transform(df_multi_column)
-
 		# Check nulls are filled
-		assert result["col_a"].null_count() == 0  # type: ignore
-		assert result["col_b"].null_count() == 0  # type: ignore
+		assert transformed_df["col_a"].null_count() == 0
+		assert transformed_df["col_b"].null_count() == 0
 
-	def test_transform_without_fit_raises(self, df_multi_column: pl.DataFrame) -> None:
+	def test_transform_without_fit_raises(
+		self,
+		df_multi_column: pl.DataFrame,
+		mct_factory: Callable[..., MultiColumnTransformer],
+	) -> None:
 		"""Test that transform without fit raises."""
-		transformers = [
-			ColumnTransformerMetadata(
-				name="imputer",
-				columns=["col_a"],
-				transformer=Imputer(strategy=Strategy.MEAN),
-			)
-		]
-		mct = MultiColumnTransformer(transformers)
+		mct = mct_factory(["col_a"])
 
 		with pytest.raises(RuntimeError, match="must be fitted"):
 			mct.transform(df_multi_column)
 
-	def test_preserves_column_order(self, df_multi_column: pl.DataFrame) -> None:
+	def test_preserves_column_order(
+		self, df_multi_column: pl.DataFrame, transformed_df: pl.DataFrame
+	) -> None:
 		"""Test that column order is preserved."""
-		transformers = [
-			ColumnTransformerMetadata(
-				name="imputer",
-				columns=["col_a", "col_b"],
-				transformer=Imputer(strategy=Strategy.MEAN),
-			)
-		]
-		mct = MultiColumnTransformer(transformers)
-		result = mct.fit_transform(df_multi_column)
+		assert transformed_df.columns == df_multi_column.columns
 
-		assert result.columns == df_multi_column.columns
-
-	def test_preserves_shape(self, df_multi_column: pl.DataFrame) -> None:
+	def test_preserves_shape(
+		self, df_multi_column: pl.DataFrame, transformed_df: pl.DataFrame
+	) -> None:
 		"""Test that shape is preserved."""
-		transformers = [
-			ColumnTransformerMetadata(
-				name="imputer",
-				columns=["col_a", "col_b"],
-				transformer=Imputer(strategy=Strategy.MEAN),
-			)
-		]
-		mct = MultiColumnTransformer(transformers)
-		result = mct.fit_transform(df_multi_column)
-
-		assert result.shape == df_multi_column.shape  # type: ignore
+		assert transformed_df.shape == df_multi_column.shape
 
 	def test_untransformed_columns_unchanged(
-		self, df_multi_column: pl.DataFrame
+		self, df_multi_column: pl.DataFrame, transformed_df: pl.DataFrame
 	) -> None:
 		"""Test that columns not in transformers are unchanged."""
-		transformers = [
-			ColumnTransformerMetadata(
-				name="imputer",
-				columns=["col_a"],
-				transformer=Imputer(strategy=Strategy.MEAN),
-			)
-		]
-		mct = MultiColumnTransformer(transformers)
-		result = mct.fit_transform(df_multi_column)
-
 		# col_c should be unchanged
-		assert result["col_c"].to_list() == df_multi_column["col_c"].to_list()  # type: ignore
+		assert transformed_df["col_c"].equals(df_multi_column["col_c"])
 
-	def test_by_dtype_selection(self, df_multi_column: pl.DataFrame) -> None:
+	def test_by_dtype_selection(
+		self, mean_imputer: Imputer, df_multi_column: pl.DataFrame
+	) -> None:
 		"""Test selecting columns by dtype."""
 		transformers = [
 			ColumnTransformerMetadata(
 				name="imputer",
 				columns=[pl.Float64],
-				transformer=Imputer(strategy=Strategy.MEAN),
+				transformer=mean_imputer,
 			)
 		]
 		mct = MultiColumnTransformer(transformers)
@@ -147,54 +112,109 @@ class TestMultiColumnTransformer:
 		for col in float_cols:
 			assert col in mct.col_to_transformer
 
-	def test_get_transformer(self, df_multi_column: pl.DataFrame) -> None:
+		# The shared prototype is copied, never fitted itself
+		assert mean_imputer.is_fitted is False
+
+	def test_get_transformer(self, fitted_mct: MultiColumnTransformer) -> None:
 		"""Test getting transformer for a column."""
+		tf = fitted_mct.get_transformer("col_a")
+		assert tf is not None
+		assert isinstance(tf, Imputer)
+
+		tf_none = fitted_mct.get_transformer("nonexistent")
+		assert tf_none is None
+
+	def test_lazyframe_support(
+		self,
+		lf_multi_column: pl.LazyFrame,
+		mct_factory: Callable[..., MultiColumnTransformer],
+	) -> None:
+		"""Test that LazyFrame is supported."""
+		mct = mct_factory()
+		result = mct.fit_transform(lf_multi_column)
+
+		assert isinstance(result, pl.LazyFrame)
+
+		# Collect and check nulls are filled
+		collected = result.collect()
+		assert collected["col_a"].null_count() == 0
+		assert collected["col_b"].null_count() == 0
+
+	def test_parallel_transform_matches_sequential(
+		self, df_multi_column: pl.DataFrame, monkeypatch: pytest.MonkeyPatch
+	) -> None:
+		"""Test that the thread pool dispatch matches per-column dispatch."""
+		cols = ["col_a", "col_b", "col_c"]
 		transformers = [
 			ColumnTransformerMetadata(
 				name="imputer",
-				columns=["col_a"],
-				transformer=Imputer(strategy=Strategy.MEAN),
+				columns=cols,
+				transformer=RollingImputer(window_size=3),
 			)
 		]
-		mct = MultiColumnTransformer(transformers)
-		mct.fit(df_multi_column)
+		mct = MultiColumnTransformer(transformers).fit(df_multi_column)
 
-		tf = mct.get_transformer("col_a")
-		assert tf is not None
-		assert isinstance(tf, Imputer)
+		monkeypatch.setattr(pl, "thread_pool_size", lambda: 1)
+		sequential = mct.transform(df_multi_column)
 
-		tf_none = mct.get_transformer("nonexistent")
-		assert tf_none is None
+		calls = Counter[str]()
+		for col in cols:
+			tf = mct.col_to_transformer[col]
 
-	def test_lazyframe_support(self, lf_multi_column: pl.LazyFrame) -> None:
-		"""Test that LazyFrame is supported."""
+			def counted(
+				s: pl.Series, col: str = col, transform: Callable = tf.transform
+			) -> pl.Series:
+				calls[col] += 1
+				return transform(s)
+
+			monkeypatch.setattr(tf, "transform", counted)
+
+		monkeypatch.setattr(pl, "thread_pool_size", lambda: 4)
+		parallel = mct.transform(df_multi_column.lazy())
+
+		assert isinstance(parallel, pl.LazyFrame)
+		assert parallel.collect().equals(sequential)  # type: ignore
+		# Each column is transformed exactly once, not once per struct field
+		assert calls == dict.fromkeys(cols, 1)
+
+	def test_parallel_pool_bounded_by_polars_threads(
+		self, df_multi_column: pl.DataFrame, monkeypatch: pytest.MonkeyPatch
+	) -> None:
+		"""Test that the thread pool never exceeds the Polars thread pool size."""
 		transformers = [
 			ColumnTransformerMetadata(
 				name="imputer",
-				columns=["col_a", "col_b"],
-				transformer=Imputer(strategy=Strategy.MEAN),
+				columns=["col_a", "col_b", "col_c"],
+				transformer=RollingImputer(window_size=3),
 			)
 		]
-		mct = MultiColumnTransformer(transformers)
-		result = mct.fit_transform(lf_multi_column)
+		mct = MultiColumnTransformer(transformers).fit(df_multi_column)
+		pool_sizes: list[int] = []
 
-		assert isinstance(result, pl.LazyFrame)
+		def recording_executor(max_workers: int) -> ThreadPoolExecutor:
+			pool_sizes.append(max_workers)
+			return ThreadPoolExecutor(max_workers)
 
-		# Collect and check nulls are filled
-		collected = result.collect()
-		assert collected["col_a"].null_count() == 0
-		assert collected["col_b"].null_count() == 0
+		monkeypatch.setattr(
+			"polars_timeseries_utils.transformers.composable.multi_column_transformer"
+			".ThreadPoolExecutor",
+			recording_executor,
+		)
+		monkeypatch.setattr(pl, "thread_pool_size", lambda: 2)
+		mct.transform(df_multi_column)
+
+		assert pool_sizes == [2]
 
 
 class TestColSelector:
 	"""Tests for the MultiColumnTransformer.col_selector static method."""
 
-	def test_col_selector_none_returns_all(self) -> None:
+	def test_col_selector_none_returns_all(self, mean_imputer: Imputer) -> None:
 		"""Test that None columns returns cs.all() selector."""
 		tf = ColumnTransformerMetadata(
 			name="test",
 			columns=None,
-			transformer=Imputer(strategy=Strategy.MEAN),
+			transformer=mean_imputer,
 		)
 		selector = MultiColumnTransformer.col_selector(tf)
 
@@ -202,36 +222,36 @@ class TestColSelector:
 		selected = df.select(selector).columns
 		assert selected == ["a", "b", "c"]
 
-	def test_col_selector_with_expr(self) -> None:
+	def test_col_selector_with_expr(self, mean_imputer: Imputer) -> None:
 		"""Test that pl.Expr is returned as-is."""
 		expr = pl.col("col_a")
 		tf = ColumnTransformerMetadata(
 			name="test",
 			columns=expr,
-			transformer=Imputer(strategy=Strategy.MEAN),
+			transformer=mean_imputer,
 		)
 		selector = MultiColumnTransformer.col_selector(tf)
 
 		assert selector is expr
 
-	def test_col_selector_with_selector(self) -> None:
+	def test_col_selector_with_selector(self, mean_imputer: Imputer) -> None:
 		"""Test that cs.Selector is returned as-is."""
 		sel = cs.numeric()
 		tf = ColumnTransformerMetadata(
 			name="test",
 			columns=sel,
-			transformer=Imputer(strategy=Strategy.MEAN),
+			transformer=mean_imputer,
 		)
 		selector = MultiColumnTransformer.col_selector(tf)
 
 		assert selector is sel
 
-	def test_col_selector_with_string_list(self) -> None:
+	def test_col_selector_with_string_list(self, mean_imputer: Imputer) -> None:
 		"""Test that list[str] returns cs.by_name() selector."""
 		tf = ColumnTransformerMetadata(
 			name="test",
 			columns=["col_a", "col_b"],
-			transformer=Imputer(strategy=Strategy.MEAN),
+			transformer=mean_imputer,
 		)
 		selector = MultiColumnTransformer.col_selector(tf)
 
@@ -240,12 +260,12 @@ class TestColSelector:
 		selected = df.select(selector).columns
 		assert selected == ["col_a", "col_b"]
 
-	def test_col_selector_with_dtype_list(self) -> None:
+	def test_col_selector_with_dtype_list(self, mean_imputer: Imputer) -> None:
 		"""Test that list[pl.DataType] returns cs.by_dtype() selector."""
 		tf = ColumnTransformerMetadata(
 			name="test",
 			columns=[pl.Float64],
-			transformer=Imputer(strategy=Strategy.MEAN),
+			transformer=mean_imputer,
 		)
 		selector = MultiColumnTransformer.col_selector(tf)
 
@@ -256,12 +276,12 @@ class TestColSelector:
 		selected = df.select(selector).columns
 		assert selected == ["a", "c"]
 
-	def test_col_selector_with_dtype_class(self) -> None:
+	def test_col_selector_with_dtype_class(self, mean_imputer: Imputer) -> None:
 		"""Test that dtype classes (not instances) work."""
 		tf = ColumnTransformerMetadata(
 			name="test",
 			columns=[pl.Int64, pl.Float64],
-			transformer=Imputer(strategy=Strategy.MEAN),
+			transformer=mean_imputer,
 		)
 		selector = MultiColumnTransformer.col_selector(tf)
 
@@ -271,12 +291,14 @@ class TestColSelector:
 		selected = df.select(selector).columns
 		assert set(selected) == {"a", "b"}
 
-	def test_col_selector_with_mixed_dtype_instances_and_classes(self) -> None:
+	def test_col_selector_with_mixed_dtype_instances_and_classes(
+		self, mean_imputer: Imputer
+	) -> None:
 		"""Test that mixed dtype instances and classes work."""
 		tf = ColumnTransformerMetadata(
 			name="test",
 			columns=[pl.Float64(), pl.Int64],  # instance and class
-			transformer=Imputer(strategy=Strategy.MEAN),
+			transformer=mean_imputer,
 		)
 		selector = MultiColumnTransformer.col_selector(tf)
 
@@ -286,12 +308,12 @@ class TestColSelector:
 		selected = df.select(selector).columns
 		assert set(selected) == {"a", "b"}
 
-	def test_col_selector_invalid_type_raises(self) -> None:
+	def test_col_selector_invalid_type_raises(self, mean_imputer: Imputer) -> None:
 		"""Test that invalid column types raise ValueError."""
 		tf = ColumnTransformerMetadata(
 			name="test",
 			columns=[1, 2, 3],  # type: ignore
-			transformer=Imputer(strategy=Strategy.MEAN),
+			transformer=mean_imputer,
 		)
 
 		with pytest.raises(
@@ -301,12 +323,14 @@ class TestColSelector:
 		):
 			MultiColumnTransformer.col_selector(tf)
 
-	def test_col_selector_mixed_str_and_dtype_raises(self) -> None:
+	def test_col_selector_mixed_str_and_dtype_raises(
+		self, mean_imputer: Imputer
+	) -> None:
 		"""Test that mixed str and dtype raises ValueError."""
 		tf = ColumnTransformerMetadata(
 			name="test",
 			columns=["col_a", pl.Float64],  # type: ignore
-			transformer=Imputer(strategy=Strategy.MEAN),
+			transformer=mean_imputer,
 		)
 
 		with pytest.raises(
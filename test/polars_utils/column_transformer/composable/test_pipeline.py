@@ -1,3 +1,5 @@
+from collections.abc import Callable
+
 import polars as pl
 import pytest
 
@@ -7,58 +9,38 @@ from polars_timeseries_utils.transformers.composable import (
 	MultiColumnTransformerMetadata,
 	Pipeline,
 )
-from polars_timeseries_utils.transformers.single import Imputer, MinMaxScaler
-from polars_timeseries_utils.transformers.single.types import Strategy
+from polars_timeseries_utils.transformers.single import MinMaxScaler
+
+
+@pytest.fixture(scope="module")
+def pipeline_result(
+	df_multi_column: pl.DataFrame, pipeline_factory: Callable[..., Pipeline]
+) -> pl.DataFrame:
+	"""df_multi_column fit-transformed by a pipeline mean-imputing col_a and col_b."""
+	return pipeline_factory().fit_transform(df_multi_column)  # type: ignore
 
 
 class TestPipeline:
 	"""Tests for the Pipeline class."""
 
-	def test_init(self) -> None:
+	def test_init(self, pipeline_factory: Callable[..., Pipeline]) -> None:
 		"""Test initialization."""
-		step1 = MultiColumnTransformer(
-			[
-				ColumnTransformerMetadata(
-					name="imputer",
-					columns=["col_a"],
-					transformer=Imputer(strategy=Strategy.MEAN),
-				)
-			]
-		)
-		steps = [MultiColumnTransformerMetadata(name="step1", transformer=step1)]
-		pipeline = Pipeline(steps)
+		pipeline = pipeline_factory(["col_a"])
 
 		assert len(pipeline.steps) == 1
 
-	def test_single_step(self, df_multi_column: pl.DataFrame) -> None:
+	def test_single_step(self, pipeline_result: pl.DataFrame) -> None:
 		"""Test pipeline with single step."""
-		step1 = MultiColumnTransformer(
-			[
-				ColumnTransformerMetadata(
-					name="imputer",
-					columns=["col_a", "col_b"],
-					transformer=Imputer(strategy=Strategy.MEAN),
-				)
-			]
-		)
-		steps = [MultiColumnTransformerMetadata(name="step1", transformer=step1)]
-		pipeline = Pipeline(steps)
-		result = pipeline.fit_transform(df_multi_column)
-
-		assert result["col_a"].null_count() == 0  # type: ignore
-		assert result["col_b"].null_count() == 0  # type: ignore
-
-	def test_multi_step(self, df_multi_column: pl.DataFrame) -> None:
+		assert pipeline_result["col_a"].null_count() == 0
+		assert pipeline_result["col_b"].null_count() == 0
+
+	def test_multi_step(
+		self,
+		df_multi_column: pl.DataFrame,
+		mct_factory: Callable[..., MultiColumnTransformer],
+	) -> None:
 		"""Test pipeline with multiple steps."""
-		step1 = MultiColumnTransformer(
-			[
-				ColumnTransformerMetadata(
-					name="imputer",
-					columns=["col_a", "col_b"],
-					transformer=Imputer(strategy=Strategy.MEAN),
-				)
-			]
-		)
+		step1 = mct_factory()
 		step2 = MultiColumnTransformer(
 			[
 				ColumnTransformerMetadata(
@@ -83,53 +65,23 @@ class TestPipeline:
 		assert result["col_c"].min() >= -0.1  # type: ignore
 		assert result["col_c"].max() <= 1.1  # type: ignore
 
-	def test_preserves_shape(self, df_multi_column: pl.DataFrame) -> None:
+	def test_preserves_shape(
+		self, df_multi_column: pl.DataFrame, pipeline_result: pl.DataFrame
+	) -> None:
 		"""Test that shape is preserved through pipeline."""
-		step1 = MultiColumnTransformer(
-			[
-				ColumnTransformerMetadata(
-					name="imputer",
-					columns=["col_a"],
-					transformer=Imputer(strategy=Strategy.MEAN),
-				)
-			]
-		)
-		steps = [MultiColumnTransformerMetadata(name="step1", transformer=step1)]
-		pipeline = Pipeline(steps)
-		result = pipeline.fit_transform(df_multi_column)
+		assert pipeline_result.shape == df_multi_column.shape
 
-		assert result.shape == df_multi_column.shape  # type: ignore
-
-	def test_preserves_columns(self, df_multi_column: pl.DataFrame) -> None:
+	def test_preserves_columns(
+		self, df_multi_column: pl.DataFrame, pipeline_result: pl.DataFrame
+	) -> None:
 		"""Test that columns are preserved through pipeline."""
-		step1 = MultiColumnTransformer(
-			[
-				ColumnTransformerMetadata(
-					name="imputer",
-					columns=["col_a"],
-					transformer=Imputer(strategy=Strategy.MEAN),
-				)
-			]
-		)
-		steps = [MultiColumnTransformerMetadata(name="step1", transformer=step1)]
-		pipeline = Pipeline(steps)
-		result = pipeline.fit_transform(df_multi_column)
-
-		assert result.columns == df_multi_column.columns
+		assert pipeline_result.columns == df_multi_column.columns
 
-	def test_lazyframe_support(self, lf_multi_column: pl.LazyFrame) -> None:
+	def test_lazyframe_support(
+		self, lf_multi_column: pl.LazyFrame, pipeline_factory: Callable[..., Pipeline]
+	) -> None:
 		"""Test that LazyFrame is supported."""
-		step1 = MultiColumnTransformer(
-			[
-				ColumnTransformerMetadata(
-					name="imputer",
-					columns=["col_a", "col_b"],
-					transformer=Imputer(strategy=Strategy.MEAN),
-				)
-			]
-		)
-		steps = [MultiColumnTransformerMetadata(name="step1", transformer=step1)]
-		pipeline = Pipeline(steps)
+		pipeline = pipeline_factory()
 		result = pipeline.fit_transform(lf_multi_column)
 
 		assert isinstance(result, pl.LazyFrame)
@@ -137,24 +89,26 @@ class TestPipeline:
 		collected = result.collect()
 		assert collected["col_a"].null_count() == 0
 
+	def test_dataframe_returns_dataframe(
+		self, df_multi_column: pl.DataFrame, pipeline_factory: Callable[..., Pipeline]
+	) -> None:
+		"""Test that a DataFrame input is returned as a collected DataFrame."""
+		pipeline = pipeline_factory().fit(df_multi_column)
+		result = pipeline.transform(df_multi_column)
+
+		assert isinstance(result, pl.DataFrame)
+		assert result["col_a"].null_count() == 0
+
 	def test_empty_pipeline_raises(self) -> None:
 		"""Test that empty pipeline raises ValueError."""
 		with pytest.raises(ValueError, match="must have at least one step"):
 			Pipeline([])
 
-	def test_transform_without_fit_raises(self, df_multi_column: pl.DataFrame) -> None:
+	def test_transform_without_fit_raises(
+		self, df_multi_column: pl.DataFrame, pipeline_factory: Callable[..., Pipeline]
+	) -> None:
 		"""Test that transform without fit raises."""
-		step1 = MultiColumnTransformer(
-			[
-				ColumnTransformerMetadata(
-					name="imputer",
-					columns=["col_a"],
-					transformer=Imputer(strategy=Strategy.MEAN),
-				)
-			]
-		)
-		steps = [MultiColumnTransformerMetadata(name="step1", transformer=step1)]
-		pipeline = Pipeline(steps)
+		pipeline = pipeline_factory(["col_a"])
 
 		with pytest.raises(RuntimeError, match="must be fitted"):
 			pipeline.transform(df_multi_column)
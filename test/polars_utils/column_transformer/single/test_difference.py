@@ -37,6 +37,17 @@ class TestDiffTransformer:
 		assert result[3] == 1.0
 		assert result[4] == 1.0
 
+	def test_third_order_diff(self) -> None:
+		"""Test third-order differencing of a cubic series."""
+		s = pl.Series("value", [float(i**3) for i in range(7)])
+		transformer = DiffTransformer(order=3)
+
+		result = transformer.fit_transform(s)
+
+		# Third difference of x^3 is constant 3! = 6
+		assert result.head(3).null_count() == 3
+		assert result.tail(4).to_list() == [6.0, 6.0, 6.0, 6.0]
+
 	def test_seasonal_diff(self) -> None:
 		"""Test seasonal differencing with periods > 1."""
 		s = pl.Series("value", [1.0, 2.0, 3.0, 4.0, 5.0, 6.0])
@@ -132,7 +132,7 @@ class TestImputer:
 		imputer = Imputer(strategy=Strategy.MEAN)
 		result = imputer.fit_transform(series_no_nulls)
 
-		assert result.to_list() == series_no_nulls.to_list()
+		assert result.equals(series_no_nulls)
 
 	def test_preserves_dtype(self, series_with_nulls: pl.Series) -> None:
 		"""Test that the original dtype is preserved."""
@@ -155,6 +155,32 @@ class TestImputer:
 
 		assert result.null_count() == 0
 
+	def test_fit_uses_current_strategy(self, series_with_nulls: pl.Series) -> None:
+		"""Test that fit follows a strategy reassigned after construction."""
+		imputer = Imputer(strategy=Strategy.MEAN)
+		imputer.strategy = Strategy.MAX
+		imputer.fit(series_with_nulls)
+
+		assert imputer.fitted_value == 10.0
+
+	@pytest.mark.parametrize("strategy", [Strategy.MEAN, Strategy.MEDIAN])
+	def test_fit_unsupported_dtype_raises(self, strategy: Strategy) -> None:
+		"""Test that aggregating a String series raises RuntimeError."""
+		imputer = Imputer(strategy=strategy)
+
+		with pytest.raises(RuntimeError, match="could not be fitted with strategy"):
+			imputer.fit(pl.Series("value", ["a", None, "c"]))
+
+	def test_transform_many(self, series_with_nulls: pl.Series) -> None:
+		"""Test that transform_many fills every given column."""
+		imputer = Imputer(strategy=Strategy.MEAN).fit(series_with_nulls)
+		lf = pl.LazyFrame({"a": series_with_nulls, "b": series_with_nulls})
+		result = imputer.transform_many(lf, ["a", "b"]).collect()
+
+		expected = imputer.transform(series_with_nulls)
+		assert result["a"].equals(expected)
+		assert result["b"].equals(expected)
+
 
 class TestRollingImputer:
 	"""Tests for the RollingImputer class."""
@@ -166,6 +192,7 @@ class TestRollingImputer:
 		assert imputer.strategy == RollingStrategy.MEAN
 		assert imputer.min_samples == 1
 		assert imputer.center is False
+		assert imputer.interpolate is False
 
 	def test_rolling_mean_imputation(self, series_with_nulls: pl.Series) -> None:
 		"""Test rolling mean imputation."""
@@ -221,3 +248,18 @@ class TestRollingImputer:
 
 		assert result.null_count() == 0
 		assert len(result) == len(series_with_nulls)
+
+	def test_interpolate(self) -> None:
+		"""Test that gaps wider than the window are interpolated when enabled."""
+		s = pl.Series("value", [1.0, None, None, None, 5.0])
+
+		result = RollingImputer(window_size=2).fit_transform(s)
+		result_interpolated = RollingImputer(
+			window_size=2, interpolate=True
+		).fit_transform(s)
+
+		assert result.to_list() == [1.0, 1.0, 1.0, 1.0, 5.0]
+		# Index 1 is filled by the window, the rest is interpolated from 1.0 to 5.0
+		assert result_interpolated.to_list() == pytest.approx(
+			[1.0, 1.0, 7 / 3, 11 / 3, 5.0]
+		)
@@ -51,3 +51,14 @@ class TestLagTransformer:
 
 		assert result[0] is None
 		assert result[1] == 1.0
+
+	def test_transform_multi(self) -> None:
+		"""Test that transform_multi creates one column per lag."""
+		s = pl.Series("value", [1.0, 2.0, 3.0, 4.0, 5.0])
+		transformer = LagTransformer(lags=[1, 2], fill_value=0.0)
+
+		result = transformer.transform_multi(s)
+
+		assert result.columns == ["value_lag1", "value_lag2"]
+		assert result["value_lag1"].to_list() == [0.0, 1.0, 2.0, 3.0, 4.0]
+		assert result["value_lag2"].to_list() == [0.0, 0.0, 1.0, 2.0, 3.0]
@@ -1,3 +1,4 @@
+import numpy as np
 import polars as pl
 import pytest
 
@@ -81,6 +82,56 @@ class TestMinMaxScaler:
 		assert result[0] == pytest.approx(0.5, abs=0.01)  # type: ignore
 		assert result[1] == pytest.approx(0.75, abs=0.01)  # type: ignore
 
+	@pytest.mark.parametrize("dtype", [pl.Float32, pl.Float64])
+	def test_nullable_input_scales_like_null_free_input(
+		self, series_with_negative_values: pl.Series, dtype: type[pl.DataType]
+	) -> None:
+		"""Test that nulls only change the null positions, at either float width."""
+		s = series_with_negative_values.cast(dtype)
+		scaler = MinMaxScaler().fit(s)
+		with_null = s.extend_constant(None, 1)
+
+		result = scaler.transform(s)
+		result_with_null = scaler.transform(with_null)
+
+		assert result.dtype == result_with_null.dtype == dtype
+		np.testing.assert_allclose(
+			result_with_null.head(len(result)).to_numpy(), result.to_numpy(), rtol=1e-6
+		)
+		assert result[0] == pytest.approx(0.0)  # type: ignore
+		assert result[-1] == pytest.approx(1.0)  # type: ignore
+		assert result_with_null[-1] is None
+
+	def test_updated_bounds_apply_to_every_path(self) -> None:
+		"""Test that reassigned min/max are used by every transform path."""
+		scaler = MinMaxScaler().fit(pl.Series("value", [0.0, 10.0]))
+		scaler.max = 20.0
+
+		result = scaler.transform(pl.Series("value", [10.0]))
+		result_with_null = scaler.transform(pl.Series("value", [10.0, None]))
+		inversed = scaler.inverse_transform(pl.Series("value", [0.5]))
+
+		assert result[0] == pytest.approx(0.5)  # type: ignore
+		assert result_with_null[0] == pytest.approx(0.5)  # type: ignore
+		assert inversed[0] == pytest.approx(10.0)  # type: ignore
+
+	def test_transform_many(self, series_for_scaling: pl.Series) -> None:
+		"""Test that transform_many matches transform on every column."""
+		scaler = MinMaxScaler().fit(series_for_scaling)
+		lf = pl.LazyFrame(
+			{"a": series_for_scaling, "b": series_for_scaling.reverse(), "c": [1] * 5}
+		)
+		result = scaler.transform_many(lf, ["a", "b"]).collect()
+
+		np.testing.assert_allclose(
+			result["a"].to_numpy(), scaler.transform(series_for_scaling).to_numpy()
+		)
+		np.testing.assert_allclose(
+			result["b"].to_numpy(),
+			scaler.transform(series_for_scaling.reverse()).to_numpy(),
+		)
+		assert result["c"].to_list() == [1] * 5
+
 	def test_inverse_transform_roundtrip(self) -> None:
 		"""Test that inverse_transform reverses transform."""
 		s = pl.Series("value", [1.0, 2.0, 3.0, 4.0, 5.0])
@@ -156,6 +207,15 @@ class TestStandardScaler:
 
 		assert result.dtype == series_for_scaling.dtype
 
+	def test_preserves_float32(self, series_for_scaling: pl.Series) -> None:
+		"""Test that Float32 input is not widened to Float64."""
+		s = series_for_scaling.cast(pl.Float32)
+		scaler = StandardScaler()
+		result = scaler.fit_transform(s)
+
+		assert result.dtype == pl.Float32
+		assert result.mean() == pytest.approx(0.0, abs=0.01)  # type: ignore
+
 	def test_separate_fit_transform(self, series_for_scaling: pl.Series) -> None:
 		"""Test separate fit and transform calls."""
 		scaler = StandardScaler()
@@ -1,3 +1,4 @@
+import numpy as np
 import polars as pl
 import pytest
 
@@ -70,6 +71,37 @@ class TestSmoother:
 
 		assert len(result) == len(series_with_outliers)
 
+	def test_nan_clipped_as_upper_outlier_with_and_without_nulls(
+		self, series_with_outliers: pl.Series
+	) -> None:
+		"""Test that NaN is clipped to the upper bound whether or not nulls exist."""
+		smoother = Smoother(max_zscore=2.0).fit(series_with_outliers)
+		upper = smoother.median + 2.0 * smoother.mad  # type: ignore
+		s = series_with_outliers.extend_constant(float("nan"), 1)
+
+		result = smoother.transform(s)
+		result_with_null = smoother.transform(s.extend_constant(None, 1))
+
+		np.testing.assert_allclose(
+			result_with_null.head(len(result)).to_numpy(), result.to_numpy()
+		)
+		assert result[-1] == pytest.approx(upper)  # type: ignore
+		assert result_with_null[-1] is None
+
+	def test_updated_median_applies_to_every_path(self) -> None:
+		"""Test that a reassigned median is used with and without nulls."""
+		smoother = Smoother(max_zscore=3.0).fit(
+			pl.Series("value", [1.0, 2.0, 3.0, 4.0, 5.0])
+		)
+		smoother.median = 100.0
+		clipped = 100.0 - 3.0 * smoother.mad  # type: ignore
+
+		result = smoother.transform(pl.Series("value", [3.0]))
+		result_with_null = smoother.transform(pl.Series("value", [3.0, None]))
+
+		assert result[0] == pytest.approx(clipped)  # type: ignore
+		assert result_with_null[0] == pytest.approx(clipped)  # type: ignore
+
 
 class TestRollingSmoother:
 	"""Tests for the RollingSmoother class."""
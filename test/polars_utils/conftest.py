@@ -1,66 +1,77 @@
+from collections.abc import Callable
 from datetime import datetime
 
+import numpy as np
 import polars as pl
 import pytest
 
+from polars_timeseries_utils.transformers.composable import (
+	ColumnTransformerMetadata,
+	MultiColumnTransformer,
+	MultiColumnTransformerMetadata,
+	Pipeline,
+)
+from polars_timeseries_utils.transformers.single import Imputer, Strategy
+
+_IDX = np.arange(1, 21, dtype=np.float64)
+_NUMERIC = pl.from_numpy(
+	np.column_stack([_IDX * 10, _IDX * 5 + 3, _IDX * 2 - 1]),
+	schema=["value", "measurement", "target"],
+)
+_TIMESTAMPS = pl.datetime_range(
+	datetime(2023, 1, 1), datetime(2023, 1, 20), "1d", eager=True
+)
+
+
+def _with_index(index: pl.Series, name: str = "timestamp") -> pl.DataFrame:
+	"""Prepend an index column to the shared numeric columns."""
+	return pl.concat([index.alias(name).to_frame(), _NUMERIC], how="horizontal")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_up_polars() -> None:
+	"""Start the Polars thread pool and touch the rolling kernels once per session."""
+	pl.DataFrame({"v": np.arange(16.0)}).lazy().select(
+		median=pl.col("v").rolling_median(3),
+		mean=pl.col("v").rolling_mean(3),
+		centered=pl.col("v").rolling_median(3, center=True),
+	).collect()
+
+
 # =============================================================================
 # CLEAN DATAFRAMES (no missing values, proper types)
 # =============================================================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def df_clean() -> pl.DataFrame:
 	"""
 	Clean DataFrame with datetime timestamp column named 'timestamp' and numeric
 	columns.
 	"""
-	return pl.DataFrame(
-		{
-			"timestamp": [datetime(2023, 1, i) for i in range(1, 21)],
-			"value": [float(i * 10) for i in range(1, 21)],
-			"measurement": [float(i * 5 + 3) for i in range(1, 21)],
-			"target": [float(i * 2 - 1) for i in range(1, 21)],
-		}
-	)
+	return _with_index(_TIMESTAMPS)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def df_clean_date_col() -> pl.DataFrame:
 	"""Clean DataFrame with datetime column named 'date'."""
-	return pl.DataFrame(
-		{
-			"date": [datetime(2023, 1, i) for i in range(1, 21)],
-			"value": [float(i * 10) for i in range(1, 21)],
-			"y": [float(i * 5 + 3) for i in range(1, 21)],
-			"extra": [float(i * 2 - 1) for i in range(1, 21)],
-		}
+	return _with_index(_TIMESTAMPS, "date").rename(
+		{"measurement": "y", "target": "extra"}
 	)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def df_clean_ds_col() -> pl.DataFrame:
 	"""Clean DataFrame with datetime column named 'ds' (Prophet format)."""
-	return pl.DataFrame(
-		{
-			"ds": [datetime(2023, 1, i) for i in range(1, 21)],
-			"y": [float(i * 10) for i in range(1, 21)],
-			"value": [float(i * 5 + 3) for i in range(1, 21)],
-			"extra": [float(i * 2 - 1) for i in range(1, 21)],
-		}
+	return _with_index(_TIMESTAMPS, "ds").rename(
+		{"value": "y", "measurement": "value", "target": "extra"}
 	)
 
 
-@pytest.fixture
-def lf_clean() -> pl.LazyFrame:
+@pytest.fixture(scope="session")
+def lf_clean(df_clean: pl.DataFrame) -> pl.LazyFrame:
 	"""Clean LazyFrame with datetime timestamp column."""
-	return pl.DataFrame(
-		{
-			"timestamp": [datetime(2023, 1, i) for i in range(1, 21)],
-			"value": [float(i * 10) for i in range(1, 21)],
-			"measurement": [float(i * 5 + 3) for i in range(1, 21)],
-			"target": [float(i * 2 - 1) for i in range(1, 21)],
-		}
-	).lazy()
+	return df_clean.lazy()
 
 
 # =============================================================================
@@ -68,28 +79,28 @@ def lf_clean() -> pl.LazyFrame:
 # =============================================================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def series_with_nulls() -> pl.Series:
 	"""Series with null values for imputer testing."""
 	return pl.Series("value", [1.0, None, 3.0, None, 5.0, 6.0, None, 8.0, 9.0, 10.0])
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def series_with_nulls_at_edges() -> pl.Series:
 	"""Series with null values at the beginning and end."""
 	return pl.Series("value", [None, None, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, None, None])
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def series_no_nulls() -> pl.Series:
 	"""Series without null values."""
-	return pl.Series("value", [float(i) for i in range(1, 11)])
+	return pl.Series("value", np.arange(1, 11, dtype=np.float64))
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def series_all_nulls() -> pl.Series:
 	"""Series with all null values."""
-	return pl.Series("value", [None] * 10, dtype=pl.Float64)
+	return pl.repeat(None, 10, dtype=pl.Float64, eager=True).alias("value")
 
 
 # =============================================================================
@@ -97,19 +108,19 @@ def series_all_nulls() -> pl.Series:
 # =============================================================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def series_for_scaling() -> pl.Series:
 	"""Series with known min/max for scaler testing."""
 	return pl.Series("value", [0.0, 25.0, 50.0, 75.0, 100.0])
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def series_with_negative_values() -> pl.Series:
 	"""Series with negative values for scaler testing."""
 	return pl.Series("value", [-50.0, -25.0, 0.0, 25.0, 50.0])
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def series_constant() -> pl.Series:
 	"""Series with constant values (edge case for scaling)."""
 	return pl.Series("value", [5.0, 5.0, 5.0, 5.0, 5.0])
@@ -120,7 +131,7 @@ def series_constant() -> pl.Series:
 # =============================================================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def series_with_outliers() -> pl.Series:
 	"""Series with outliers for smoother testing."""
 	return pl.Series(
@@ -128,7 +139,7 @@ def series_with_outliers() -> pl.Series:
 	)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def series_normal_distribution() -> pl.Series:
 	"""Series with approximately normal distribution."""
 	return pl.Series("value", [10.0, 11.0, 9.5, 10.5, 10.2, 9.8, 10.1, 9.9, 10.3, 10.0])
@@ -139,160 +150,96 @@ def series_normal_distribution() -> pl.Series:
 # =============================================================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def df_multi_column() -> pl.DataFrame:
 	"""DataFrame with multiple numeric columns for MultiColumnTransformer testing."""
 	return pl.DataFrame(
 		{
-			"timestamp": [datetime(2023, 1, i) for i in range(1, 11)],
+			"timestamp": pl.datetime_range(
+				datetime(2023, 1, 1), datetime(2023, 1, 10), "1d", eager=True
+			),
 			"col_a": [1.0, None, 3.0, 4.0, 5.0, None, 7.0, 8.0, 9.0, 10.0],
 			"col_b": [10.0, 20.0, None, 40.0, 50.0, 60.0, None, 80.0, 90.0, 100.0],
-			"col_c": [
-				100.0,
-				200.0,
-				300.0,
-				400.0,
-				500.0,
-				600.0,
-				700.0,
-				800.0,
-				900.0,
-				1000.0,
-			],
+			"col_c": np.arange(100, 1001, 100, dtype=np.float64),
 		}
 	)
 
 
-@pytest.fixture
-def lf_multi_column() -> pl.LazyFrame:
+@pytest.fixture(scope="session")
+def lf_multi_column(df_multi_column: pl.DataFrame) -> pl.LazyFrame:
 	"""LazyFrame with multiple numeric columns for MultiColumnTransformer testing."""
-	return pl.DataFrame(
-		{
-			"timestamp": [datetime(2023, 1, i) for i in range(1, 11)],
-			"col_a": [1.0, None, 3.0, 4.0, 5.0, None, 7.0, 8.0, 9.0, 10.0],
-			"col_b": [10.0, 20.0, None, 40.0, 50.0, 60.0, None, 80.0, 90.0, 100.0],
-			"col_c": [
-				100.0,
-				200.0,
-				300.0,
-				400.0,
-				500.0,
-				600.0,
-				700.0,
-				800.0,
-				900.0,
-				1000.0,
-			],
-		}
-	).lazy()
-
-
-# =============================================================================
-# UNCLEAN DATAFRAMES - String timestamps that need casting
-# =============================================================================
+	return df_multi_column.lazy()
 
 
-@pytest.fixture
-def df_unclean_timestamp_str_ymd_dash() -> pl.DataFrame:
-	"""DataFrame with string timestamp in YYYY-MM-DD format."""
-	return pl.DataFrame(
-		{
-			"timestamp": [f"2023-01-{i:02d}" for i in range(1, 21)],
-			"value": [float(i * 10) for i in range(1, 21)],
-			"measurement": [float(i * 5 + 3) for i in range(1, 21)],
-			"target": [float(i * 2 - 1) for i in range(1, 21)],
-		}
-	)
+# MultiColumnTransformer.fit deep-copies its transformers, so all tests can share one
+_IMPUTER = Imputer(strategy=Strategy.MEAN)
 
 
-@pytest.fixture
-def df_unclean_timestamp_str_dmy_dash() -> pl.DataFrame:
-	"""DataFrame with string timestamp in DD-MM-YYYY format."""
-	return pl.DataFrame(
-		{
-			"timestamp": [f"{i:02d}-01-2023" for i in range(1, 21)],
-			"value": [float(i * 10) for i in range(1, 21)],
-			"measurement": [float(i * 5 + 3) for i in range(1, 21)],
-			"target": [float(i * 2 - 1) for i in range(1, 21)],
-		}
+def _make_mct(cols: list[str] | None = None) -> MultiColumnTransformer:
+	"""Build an unfitted MultiColumnTransformer mean-imputing the given columns."""
+	return MultiColumnTransformer(
+		[
+			ColumnTransformerMetadata(
+				name="imputer",
+				columns=cols or ["col_a", "col_b"],
+				transformer=_IMPUTER,
+			)
+		]
 	)
 
 
-@pytest.fixture
-def df_unclean_timestamp_str_ymd_slash() -> pl.DataFrame:
-	"""DataFrame with string timestamp in YYYY/MM/DD format."""
-	return pl.DataFrame(
-		{
-			"timestamp": [f"2023/01/{i:02d}" for i in range(1, 21)],
-			"value": [float(i * 10) for i in range(1, 21)],
-			"measurement": [float(i * 5 + 3) for i in range(1, 21)],
-			"target": [float(i * 2 - 1) for i in range(1, 21)],
-		}
+def _make_pipeline(cols: list[str] | None = None) -> Pipeline:
+	"""Build an unfitted single-step Pipeline mean-imputing the given columns."""
+	return Pipeline(
+		[MultiColumnTransformerMetadata(name="step1", transformer=_make_mct(cols))]
 	)
 
 
-@pytest.fixture
-def df_unclean_timestamp_str_dmy_slash() -> pl.DataFrame:
-	"""DataFrame with string timestamp in DD/MM/YYYY format."""
-	return pl.DataFrame(
-		{
-			"timestamp": [f"{i:02d}/01/2023" for i in range(1, 21)],
-			"value": [float(i * 10) for i in range(1, 21)],
-			"measurement": [float(i * 5 + 3) for i in range(1, 21)],
-			"target": [float(i * 2 - 1) for i in range(1, 21)],
-		}
-	)
+@pytest.fixture(scope="session")
+def mean_imputer() -> Imputer:
+	"""Shared unfitted mean Imputer."""
+	return _IMPUTER
 
 
-@pytest.fixture
-def df_unclean_timestamp_str_datetime_ymd_dash() -> pl.DataFrame:
-	"""DataFrame with string timestamp in YYYY-MM-DD HH:MM:SS format."""
-	return pl.DataFrame(
-		{
-			"timestamp": [f"2023-01-{i:02d} 12:30:00" for i in range(1, 21)],
-			"value": [float(i * 10) for i in range(1, 21)],
-			"measurement": [float(i * 5 + 3) for i in range(1, 21)],
-			"target": [float(i * 2 - 1) for i in range(1, 21)],
-		}
-	)
+@pytest.fixture(scope="session")
+def mct_factory() -> Callable[..., MultiColumnTransformer]:
+	"""Factory for fresh mean-imputing MultiColumnTransformers."""
+	return _make_mct
 
 
-@pytest.fixture
-def df_unclean_timestamp_str_datetime_ymd_slash() -> pl.DataFrame:
-	"""DataFrame with string timestamp in YYYY/MM/DD HH:MM:SS format."""
-	return pl.DataFrame(
-		{
-			"timestamp": [f"2023/01/{i:02d} 12:30:00" for i in range(1, 21)],
-			"value": [float(i * 10) for i in range(1, 21)],
-			"measurement": [float(i * 5 + 3) for i in range(1, 21)],
-			"target": [float(i * 2 - 1) for i in range(1, 21)],
-		}
-	)
+@pytest.fixture(scope="session")
+def pipeline_factory() -> Callable[..., Pipeline]:
+	"""Factory for fresh single-step mean-imputing Pipelines."""
+	return _make_pipeline
 
 
-@pytest.fixture
-def df_unclean_timestamp_str_datetime_dmy_dash() -> pl.DataFrame:
-	"""DataFrame with string timestamp in DD-MM-YYYY HH:MM:SS format."""
-	return pl.DataFrame(
-		{
-			"timestamp": [f"{i:02d}-01-2023 12:30:00" for i in range(1, 21)],
-			"value": [float(i * 10) for i in range(1, 21)],
-			"measurement": [float(i * 5 + 3) for i in range(1, 21)],
-			"target": [float(i * 2 - 1) for i in range(1, 21)],
-		}
-	)
+# =============================================================================
+# UNCLEAN DATAFRAMES - String timestamps that need casting
+# =============================================================================
 
 
-@pytest.fixture
-def df_unclean_timestamp_str_datetime_dmy_slash() -> pl.DataFrame:
-	"""DataFrame with string timestamp in DD/MM/YYYY HH:MM:SS format."""
-	return pl.DataFrame(
-		{
-			"timestamp": [f"{i:02d}/01/2023 12:30:00" for i in range(1, 21)],
-			"value": [float(i * 10) for i in range(1, 21)],
-			"measurement": [float(i * 5 + 3) for i in range(1, 21)],
-			"target": [float(i * 2 - 1) for i in range(1, 21)],
-		}
+@pytest.fixture(
+	scope="session",
+	params=[
+		"%Y-%m-%d",
+		"%d-%m-%Y",
+		"%Y/%m/%d",
+		"%d/%m/%Y",
+		"%Y-%m-%d %H:%M:%S",
+		"%d-%m-%Y %H:%M:%S",
+		"%Y/%m/%d %H:%M:%S",
+		"%d/%m/%Y %H:%M:%S",
+	],
+)
+def df_unclean_timestamp_str(request: pytest.FixtureRequest) -> pl.DataFrame:
+	"""DataFrame with string timestamp in each supported date and datetime format."""
+	return _with_index(
+		pl.datetime_range(
+			datetime(2023, 1, 1, 12, 30),
+			datetime(2023, 1, 20, 12, 30),
+			"1d",
+			eager=True,
+		).dt.strftime(request.param)
 	)
 
 
@@ -301,17 +248,10 @@ def df_unclean_timestamp_str_datetime_dmy_slash() -> pl.DataFrame:
 # =============================================================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def lf_unclean_timestamp_str() -> pl.LazyFrame:
 	"""LazyFrame with string timestamp that needs casting."""
-	return pl.DataFrame(
-		{
-			"timestamp": [f"2023-01-{i:02d}" for i in range(1, 21)],
-			"value": [float(i * 10) for i in range(1, 21)],
-			"measurement": [float(i * 5 + 3) for i in range(1, 21)],
-			"target": [float(i * 2 - 1) for i in range(1, 21)],
-		}
-	).lazy()
+	return _with_index(_TIMESTAMPS.dt.strftime("%Y-%m-%d")).lazy()
 
 
 # =============================================================================
@@ -319,17 +259,10 @@ def lf_unclean_timestamp_str() -> pl.LazyFrame:
 # =============================================================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def df_unclean_no_standard_timestamp_name() -> pl.DataFrame:
 	"""DataFrame with datetime column but non-standard name."""
-	return pl.DataFrame(
-		{
-			"my_custom_date": [datetime(2023, 1, i) for i in range(1, 21)],
-			"value": [float(i * 10) for i in range(1, 21)],
-			"measurement": [float(i * 5 + 3) for i in range(1, 21)],
-			"target": [float(i * 2 - 1) for i in range(1, 21)],
-		}
-	)
+	return _with_index(_TIMESTAMPS, "my_custom_date")
 
 
 # =============================================================================
@@ -337,40 +270,25 @@ def df_unclean_no_standard_timestamp_name() -> pl.DataFrame:
 # =============================================================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def df_invalid_no_datetime_col() -> pl.DataFrame:
 	"""DataFrame with no datetime column at all (all strings, non-date)."""
-	return pl.DataFrame(
-		{
-			"name": [f"item_{i}" for i in range(1, 21)],
-			"value": [float(i * 10) for i in range(1, 21)],
-			"measurement": [float(i * 5 + 3) for i in range(1, 21)],
-			"category": [f"cat_{i % 3}" for i in range(1, 21)],
-		}
+	idx = pl.Series(_IDX, dtype=pl.Int64)
+	return _with_index("item_" + idx.cast(pl.String), "name").select(
+		"name",
+		"value",
+		"measurement",
+		category="cat_" + (idx % 3).cast(pl.String),
 	)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def df_invalid_non_castable_timestamp() -> pl.DataFrame:
 	"""DataFrame with string timestamp column that cannot be cast to datetime."""
-	return pl.DataFrame(
-		{
-			"timestamp": [f"not_a_date_{i}" for i in range(1, 21)],
-			"value": [float(i * 10) for i in range(1, 21)],
-			"measurement": [float(i * 5 + 3) for i in range(1, 21)],
-			"target": [float(i * 2 - 1) for i in range(1, 21)],
-		}
-	)
+	return _with_index("not_a_date_" + pl.Series(_IDX, dtype=pl.Int64).cast(pl.String))
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def df_invalid_missing_specified_col() -> pl.DataFrame:
 	"""DataFrame missing a specified column name."""
-	return pl.DataFrame(
-		{
-			"date": [datetime(2023, 1, i) for i in range(1, 21)],
-			"amount": [float(i * 10) for i in range(1, 21)],
-			"measurement": [float(i * 5 + 3) for i in range(1, 21)],
-			"target": [float(i * 2 - 1) for i in range(1, 21)],
-		}
-	)
+	return _with_index(_TIMESTAMPS, "date").rename({"value": "amount"})
@@ -128,115 +128,8 @@ class TestNextTimestamp:
 
 
 class TestCastToDatetimeRaisesIfError:
-	def test_str_ymd_dash_casting(
-		self, df_unclean_timestamp_str_ymd_dash: pl.DataFrame
-	) -> None:
-		df = df_unclean_timestamp_str_ymd_dash.clone()
-		result = cast_to_datetime_raises_if_error(df[TS])
-
-		assert isinstance(result, pl.Series)
-		assert result.shape == df[TS].shape
-		assert result.dtype == pl.Datetime
-
-		df = df.with_columns(result.alias(TS))
-
-		assert df.shape == df_unclean_timestamp_str_ymd_dash.shape
-		assert df[TS].dtype == pl.Datetime
-
-	def test_str_dmy_dash_casting(
-		self, df_unclean_timestamp_str_dmy_dash: pl.DataFrame
-	) -> None:
-		df = df_unclean_timestamp_str_dmy_dash.clone()
-		result = cast_to_datetime_raises_if_error(df[TS])
-
-		assert isinstance(result, pl.Series)
-		assert result.shape == df[TS].shape
-		assert result.dtype == pl.Datetime
-
-		df = df.with_columns(result.alias(TS))
-
-		assert df.shape == df_unclean_timestamp_str_dmy_dash.shape
-		assert df[TS].dtype == pl.Datetime
-
-	def test_str_ymd_slash_casting(
-		self, df_unclean_timestamp_str_ymd_slash: pl.DataFrame
-	) -> None:
-		df = df_unclean_timestamp_str_ymd_slash.clone()
-		result = cast_to_datetime_raises_if_error(df[TS])
-
-		assert isinstance(result, pl.Series)
-		assert result.shape == df[TS].shape
-		assert result.dtype == pl.Datetime
-
-		df = df.with_columns(result.alias(TS))
-
-		assert df.shape == df_unclean_timestamp_str_ymd_slash.shape
-		assert df[TS].dtype == pl.Datetime
-
-	def test_str_dmy_slash_casting(
-		self, df_unclean_timestamp_str_dmy_slash: pl.DataFrame
-	) -> None:
-		df = df_unclean_timestamp_str_dmy_slash.clone()
-		result = cast_to_datetime_raises_if_error(df[TS])
-
-		assert isinstance(result, pl.Series)
-		assert result.shape == df[TS].shape
-		assert result.dtype == pl.Datetime
-
-		df = df.with_columns(result.alias(TS))
-
-		assert df.shape == df_unclean_timestamp_str_dmy_slash.shape
-		assert df[TS].dtype == pl.Datetime
-
-	def test_str_datetime_ymd_dash_casting(
-		self, df_unclean_timestamp_str_datetime_ymd_dash: pl.DataFrame
-	) -> None:
-		df = df_unclean_timestamp_str_datetime_ymd_dash.clone()
-		result = cast_to_datetime_raises_if_error(df[TS])
-
-		assert isinstance(result, pl.Series)
-		assert result.shape == df[TS].shape
-		assert result.dtype == pl.Datetime
-
-		df = df.with_columns(result.alias(TS))
-
-		assert df.shape == df_unclean_timestamp_str_datetime_ymd_dash.shape
-		assert df[TS].dtype == pl.Datetime
-
-	def test_str_datetime_dmy_dash_casting(
-		self, df_unclean_timestamp_str_datetime_dmy_dash: pl.DataFrame
-	) -> None:
-		df = df_unclean_timestamp_str_datetime_dmy_dash.clone()
-		result = cast_to_datetime_raises_if_error(df[TS])
-
-		assert isinstance(result, pl.Series)
-		assert result.shape == df[TS].shape
-		assert result.dtype == pl.Datetime
-
-		df = df.with_columns(result.alias(TS))
-
-		assert df.shape == df_unclean_timestamp_str_datetime_dmy_dash.shape
-		assert df[TS].dtype == pl.Datetime
-
-	def test_str_datetime_ymd_slash_casting(
-		self, df_unclean_timestamp_str_datetime_ymd_slash: pl.DataFrame
-	) -> None:
-		df = df_unclean_timestamp_str_datetime_ymd_slash.clone()
-		result = cast_to_datetime_raises_if_error(df[TS])
-
-		assert isinstance(result, pl.Series)
-		assert result.shape == df[TS].shape
-		assert result.dtype == pl.Datetime
-
-		df = df.with_columns(result.alias(TS))
-
-		assert df.shape == df_unclean_timestamp_str_datetime_ymd_slash.shape
-		assert df[TS].dtype == pl.Datetime
-
-	def test_str_datetime_dmy_slash_casting(
-		self, df_unclean_timestamp_str_datetime_dmy_slash: pl.DataFrame
-	) -> None:
-		df = df_unclean_timestamp_str_datetime_dmy_slash.clone()
+	def test_str_casting(self, df_unclean_timestamp_str: pl.DataFrame) -> None:
+		df = df_unclean_timestamp_str.clone()
 		result = cast_to_datetime_raises_if_error(df[TS])
 
 		assert isinstance(result, pl.Series)
@@ -245,7 +138,7 @@ class TestCastToDatetimeRaisesIfError:
 
 		df = df.with_columns(result.alias(TS))
 
-		assert df.shape == df_unclean_timestamp_str_datetime_dmy_slash.shape
+		assert df.shape == df_unclean_timestamp_str.shape
 		assert df[TS].dtype == pl.Datetime
 
 	def test_lf_str_timestamp_casting(
@@ -328,13 +221,13 @@ class TestHandleTimestampColumnRaisesIfError:
 		assert df[col].dtype == pl.Datetime
 
 	def test_str_timestamp_casting(
-		self, df_unclean_timestamp_str_ymd_dash: pl.DataFrame
+		self, df_unclean_timestamp_str: pl.DataFrame
 	) -> None:
-		df = df_unclean_timestamp_str_ymd_dash.clone()
+		df = df_unclean_timestamp_str.clone()
 		df, col = handle_timestamp_column_raises_if_error(df)
 
 		assert isinstance(df, pl.DataFrame)
-		assert df.shape == df_unclean_timestamp_str_ymd_dash.shape
+		assert df.shape == df_unclean_timestamp_str.shape
 		assert col == TS
 		assert df[col].dtype == pl.Datetime
 
@@ -1,4 +1,6 @@
+import numpy as np
 import polars as pl
+import pytest
 
 from polars_timeseries_utils.stats.zscore import (
 	rolling_zscore,
@@ -7,13 +9,26 @@ from polars_timeseries_utils.stats.zscore import (
 	zscore_df,
 )
 
+_LINEAR = np.arange(1.0, 11.0)
+_MEDIAN_FIVE = np.array([1.0, 3.0, 5.0, 7.0, 9.0, 5.0, 5.0, 5.0, 5.0, 5.0])
+# Trailing window of 5 with min_samples=1, so the first windows are partial
+_EXPECTED_ROLLING_MEDIAN = np.array(
+	[np.median(_MEDIAN_FIVE[max(i - 4, 0) : i + 1]) for i in range(10)]
+)
+
+
+@pytest.fixture(scope="module")
+def linear_df() -> pl.DataFrame:
+	"""DataFrame with a linearly increasing value column."""
+	return pl.from_numpy(_LINEAR[:5], schema=["value"])
+
 
 class TestZscore:
 	"""Tests for the zscore function."""
 
 	def test_basic_zscore_calculation(self) -> None:
 		"""Test basic z-score calculation on a Series."""
-		s = pl.Series("value", [1.0, 2.0, 3.0, 4.0, 5.0])
+		s = pl.Series("value", np.arange(1.0, 6.0))
 
 		result = zscore(s)
 
@@ -24,7 +39,7 @@ class TestZscore:
 
 	def test_preserves_series_name(self) -> None:
 		"""Test that the series name is preserved."""
-		s = pl.Series("my_column", [1.0, 2.0, 3.0])
+		s = pl.Series("my_column", np.arange(1.0, 4.0))
 
 		result = zscore(s)
 
@@ -32,7 +47,7 @@ class TestZscore:
 
 	def test_symmetric_distribution(self) -> None:
 		"""Test z-scores for symmetric distribution."""
-		s = pl.Series("value", [-2.0, -1.0, 0.0, 1.0, 2.0])
+		s = pl.Series("value", np.arange(-2.0, 3.0))
 
 		result = zscore(s)
 
@@ -52,12 +67,13 @@ class TestZscore:
 
 	def test_constant_values(self) -> None:
 		"""Test z-score with constant values (std = 0)."""
-		s = pl.Series("value", [5.0, 5.0, 5.0, 5.0, 5.0])
+		s = pl.Series("value", np.full(5, 5.0))
 
 		result = zscore(s)
 
 		# With constant values, std is 0, so z-scores should be NaN or 0
-		assert all(v is None or v != v or v == 0.0 for v in result.to_list())
+		# all() skips nulls, so null z-scores are accepted as well
+		assert (result.is_nan() | (result == 0.0)).all()
 
 	def test_single_value(self) -> None:
 		"""Test z-score with single value."""
@@ -69,7 +85,7 @@ class TestZscore:
 
 	def test_negative_values(self) -> None:
 		"""Test z-score with negative values."""
-		s = pl.Series("value", [-10.0, -5.0, 0.0, 5.0, 10.0])
+		s = pl.Series("value", np.linspace(-10.0, 10.0, 5))
 
 		result = zscore(s)
 
@@ -90,18 +106,16 @@ class TestZscore:
 class TestZscoreDf:
 	"""Tests for the zscore_df function."""
 
-	def test_basic_zscore_calculation(self) -> None:
+	def test_basic_zscore_calculation(self, linear_df: pl.DataFrame) -> None:
 		"""Test basic z-score calculation on DataFrame."""
-		df = pl.DataFrame({"value": [1.0, 2.0, 3.0, 4.0, 5.0]})
-
-		result = zscore_df(df, col="value")
+		result = zscore_df(linear_df, col="value")
 
 		assert "z_score" in result.columns
 		assert result.height == 5  # type: ignore
 
 	def test_custom_alias(self) -> None:
 		"""Test custom alias for z-score column."""
-		df = pl.DataFrame({"value": [1.0, 2.0, 3.0]})
+		df = pl.DataFrame({"value": np.arange(1.0, 4.0)})
 
 		result = zscore_df(df, col="value", alias="my_zscore")
 
@@ -110,7 +124,7 @@ class TestZscoreDf:
 
 	def test_preserves_original_columns(self) -> None:
 		"""Test that original columns are preserved."""
-		df = pl.DataFrame({"id": [1, 2, 3], "value": [1.0, 2.0, 3.0]})
+		df = pl.DataFrame({"id": [1, 2, 3], "value": np.arange(1.0, 4.0)})
 
 		result = zscore_df(df, col="value")
 
@@ -118,31 +132,25 @@ class TestZscoreDf:
 		assert "value" in result.columns
 		assert "z_score" in result.columns
 
-	def test_with_median_output(self) -> None:
+	def test_with_median_output(self, linear_df: pl.DataFrame) -> None:
 		"""Test including median column in output."""
-		df = pl.DataFrame({"value": [1.0, 2.0, 3.0, 4.0, 5.0]})
-
-		result = zscore_df(df, col="value", with_median="med")
+		result = zscore_df(linear_df, col="value", with_median="med")
 
 		assert "med" in result.columns
 		# Median of [1, 2, 3, 4, 5] is 3.0
-		assert result["med"][0] == 3.0  # type: ignore
+		assert result.get_column("med")[0] == 3.0  # type: ignore
 
-	def test_with_std_output(self) -> None:
+	def test_with_std_output(self, linear_df: pl.DataFrame) -> None:
 		"""Test including std column in output."""
-		df = pl.DataFrame({"value": [1.0, 2.0, 3.0, 4.0, 5.0]})
-
-		result = zscore_df(df, col="value", with_std="stdev")
+		result = zscore_df(linear_df, col="value", with_std="stdev")
 
 		assert "stdev" in result.columns
 		# std should be positive
-		assert result["stdev"][0] > 0  # type: ignore
+		assert result.get_column("stdev")[0] > 0  # type: ignore
 
-	def test_with_median_and_std_output(self) -> None:
+	def test_with_median_and_std_output(self, linear_df: pl.DataFrame) -> None:
 		"""Test including both median and std columns."""
-		df = pl.DataFrame({"value": [1.0, 2.0, 3.0, 4.0, 5.0]})
-
-		result = zscore_df(df, col="value", with_median="med", with_std="stdev")
+		result = zscore_df(linear_df, col="value", with_median="med", with_std="stdev")
 
 		assert "med" in result.columns
 		assert "stdev" in result.columns
@@ -150,7 +158,7 @@ class TestZscoreDf:
 
 	def test_lazyframe_support(self) -> None:
 		"""Test that LazyFrame is supported."""
-		df = pl.DataFrame({"value": [1.0, 2.0, 3.0]}).lazy()
+		df = pl.DataFrame({"value": np.arange(1.0, 4.0)}).lazy()
 
 		result = zscore_df(df, col="value")
 
@@ -160,21 +168,19 @@ class TestZscoreDf:
 
 	def test_dataframe_support(self) -> None:
 		"""Test that DataFrame is supported."""
-		df = pl.DataFrame({"value": [1.0, 2.0, 3.0]})
+		df = pl.DataFrame({"value": np.arange(1.0, 4.0)})
 
 		result = zscore_df(df, col="value")
 
 		assert isinstance(result, pl.DataFrame)
 		assert "z_score" in result.columns
 
-	def test_median_zscore_is_zero(self) -> None:
+	def test_median_zscore_is_zero(self, linear_df: pl.DataFrame) -> None:
 		"""Test that z-score of median value is close to zero."""
-		df = pl.DataFrame({"value": [1.0, 2.0, 3.0, 4.0, 5.0]})
-
-		result = zscore_df(df, col="value")
+		result = zscore_df(linear_df, col="value")
 
 		# 3.0 is the median, so its z-score should be near 0
-		assert abs(result["z_score"][2]) < 0.01  # type: ignore
+		assert abs(result.get_column("z_score")[2]) < 0.01  # type: ignore
 
 	def test_multiple_columns_preserved(self) -> None:
 		"""Test that all original columns are preserved."""
@@ -182,8 +188,8 @@ class TestZscoreDf:
 			{
 				"id": [1, 2, 3],
 				"name": ["a", "b", "c"],
-				"value": [1.0, 2.0, 3.0],
-				"other": [10.0, 20.0, 30.0],
+				"value": np.arange(1.0, 4.0),
+				"other": np.arange(10.0, 40.0, 10.0),
 			}
 		)
 
@@ -197,7 +203,7 @@ class TestRollingZscore:
 
 	def test_basic_rolling_zscore(self) -> None:
 		"""Test basic rolling z-score calculation on Series."""
-		s = pl.Series("value", [1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 10.0])
+		s = pl.Series("value", np.arange(1.0, 11.0))
 
 		result = rolling_zscore(s, window_size=3)
 
@@ -206,7 +212,7 @@ class TestRollingZscore:
 
 	def test_preserves_series_name(self) -> None:
 		"""Test that series name is preserved."""
-		s = pl.Series("my_column", [1.0, 2.0, 3.0, 4.0, 5.0])
+		s = pl.Series("my_column", np.arange(1.0, 6.0))
 
 		result = rolling_zscore(s, window_size=3)
 
@@ -214,7 +220,7 @@ class TestRollingZscore:
 
 	def test_window_size(self) -> None:
 		"""Test different window sizes."""
-		s = pl.Series("value", [1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 10.0])
+		s = pl.Series("value", np.arange(1.0, 11.0))
 
 		result_3 = rolling_zscore(s, window_size=3)
 		result_5 = rolling_zscore(s, window_size=5)
@@ -225,7 +231,7 @@ class TestRollingZscore:
 
 	def test_min_samples(self) -> None:
 		"""Test min_samples parameter."""
-		s = pl.Series("value", [1.0, 2.0, 3.0, 4.0, 5.0])
+		s = pl.Series("value", np.arange(1.0, 6.0))
 
 		result = rolling_zscore(s, window_size=5, min_samples=3)
 
@@ -234,7 +240,7 @@ class TestRollingZscore:
 
 	def test_centered_window(self) -> None:
 		"""Test centered window option."""
-		s = pl.Series("value", [1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0])
+		s = pl.Series("value", np.arange(1.0, 8.0))
 
 		result_left = rolling_zscore(s, window_size=3, center=False)
 		result_center = rolling_zscore(s, window_size=3, center=True)
@@ -254,7 +260,7 @@ class TestRollingZscore:
 
 	def test_fill_value(self) -> None:
 		"""Test fill_value parameter."""
-		s = pl.Series("value", [1.0, 1.0, 1.0, 1.0, 1.0])
+		s = pl.Series("value", np.full(5, 1.0))
 
 		result = rolling_zscore(s, window_size=3, fill_value=0.5)
 
@@ -272,7 +278,7 @@ class TestRollingZscore:
 
 	def test_negative_values(self) -> None:
 		"""Test rolling z-score with negative values."""
-		s = pl.Series("value", [-10.0, -5.0, 0.0, 5.0, 10.0])
+		s = pl.Series("value", np.linspace(-10.0, 10.0, 5))
 
 		result = rolling_zscore(s, window_size=3)
 
@@ -289,7 +295,7 @@ class TestRollingZscore:
 
 	def test_large_window(self) -> None:
 		"""Test with window size larger than min_samples."""
-		s = pl.Series("value", [1.0, 2.0, 3.0, 4.0, 5.0])
+		s = pl.Series("value", np.arange(1.0, 6.0))
 
 		result = rolling_zscore(s, window_size=10, min_samples=2)
 
@@ -297,84 +303,123 @@ class TestRollingZscore:
 
 	def test_single_min_sample(self) -> None:
 		"""Test with min_samples=1."""
-		s = pl.Series("value", [1.0, 2.0, 3.0])
+		s = pl.Series("value", np.arange(1.0, 4.0))
 
 		result = rolling_zscore(s, window_size=3, min_samples=1)
 
 		assert result.len() == 3
 
+	def test_approx(self) -> None:
+		"""Test approximate rolling z-score using rolling mean statistics."""
+		s = pl.Series("value", [1.0, 2.0, 3.0, 4.0, 5.0, 100.0, 6.0, 7.0, 8.0, 9.0])
+
+		result = rolling_zscore(s, window_size=3, approx=True)
+
+		assert result.len() == 10
+		assert result[5] > 1.0
+
 
 class TestRollingZscoreDf:
 	"""Tests for the rolling_zscore function."""
 
-	def test_basic_zscore_calculation(self) -> None:
+	def test_basic_zscore_calculation(self, linear_df: pl.DataFrame) -> None:
 		"""Test basic z-score calculation."""
-		df = pl.DataFrame(
-			{
-				"value": [1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 10.0],
-			}
-		)
+		result = rolling_zscore_df(linear_df.lazy(), col="value", window_size=3)
 
-		result = rolling_zscore_df(df, col="value", window_size=3)
+		assert "z_score" in result.collect_schema().names()
+		assert result.select(pl.len()).collect().item() == 5
 
-		assert "z_score" in result.columns
-		assert result.lazy().collect().height == 10
+	@pytest.mark.parametrize("dtype", [pl.Float32, pl.Float64])
+	def test_preserves_float_dtype(
+		self, linear_df: pl.DataFrame, dtype: type[pl.DataType]
+	) -> None:
+		"""Test that the outputs keep the float width of the input column."""
+		lf = linear_df.lazy().cast({"value": dtype})
 
-	def test_custom_alias(self) -> None:
-		"""Test z-score with custom alias."""
-		df = pl.DataFrame({"value": [1.0, 2.0, 3.0, 4.0, 5.0]})
+		result = rolling_zscore_df(
+			lf, col="value", window_size=3, with_median="med", with_mad="mad"
+		).collect()
 
-		result = rolling_zscore_df(df, col="value", window_size=3, alias="my_zscore")
+		assert result.schema["z_score"] == dtype
+		assert result.schema["med"] == dtype
+		assert result.schema["mad"] == dtype
 
-		assert "my_zscore" in result.columns
-		assert "z_score" not in result.columns
-
-	def test_preserves_original_columns(self) -> None:
+	def test_preserves_original_columns(self, linear_df: pl.DataFrame) -> None:
 		"""Test that original columns are preserved."""
-		df = pl.DataFrame(
-			{
-				"value": [1.0, 2.0, 3.0, 4.0, 5.0],
-				"other": [10.0, 20.0, 30.0, 40.0, 50.0],
-			}
+		lf = linear_df.lazy().with_columns(other=pl.col("value") * 10)
+
+		names = (
+			rolling_zscore_df(lf, col="value", window_size=3).collect_schema().names()
 		)
 
-		result = rolling_zscore_df(df, col="value", window_size=3)
+		assert "value" in names
+		assert "other" in names
+
+	@pytest.mark.parametrize(
+		("kwargs", "expected_col", "forbidden_col"),
+		[
+			({"alias": "my_zscore"}, "my_zscore", "z_score"),
+			({"with_median": "rolling_med"}, "rolling_med", None),
+			({"with_mad": "mad"}, "mad", None),
+			({"with_mad": "rolling_mad"}, "rolling_mad", "mad"),
+		],
+		ids=["custom_alias", "with_median", "with_mad", "custom_mad_name"],
+	)
+	def test_output_column_names(
+		self,
+		linear_df: pl.DataFrame,
+		kwargs: dict[str, str],
+		expected_col: str,
+		forbidden_col: str | None,
+	) -> None:
+		"""Test that alias and optional outputs appear under the given names."""
+		names = (
+			rolling_zscore_df(linear_df.lazy(), col="value", window_size=3, **kwargs)  # type: ignore
+			.collect_schema()
+			.names()
+		)
 
-		assert "value" in result.columns
-		assert "other" in result.columns
+		assert expected_col in names
+		if forbidden_col is not None:
+			assert forbidden_col not in names
 
-	def test_with_median_output(self) -> None:
-		"""Test including median in output."""
-		df = pl.DataFrame({"value": [1.0, 2.0, 3.0, 4.0, 5.0]})
+	def test_positional_arguments_keep_median_path(
+		self, linear_df: pl.DataFrame
+	) -> None:
+		"""Test that positional calls up to alias still use the rolling median."""
+		positional = rolling_zscore_df(linear_df, "value", 3, 1, False, 1e-5, 1e-4, "z")
+		keyword = rolling_zscore_df(linear_df, col="value", window_size=3, alias="z")
 
-		result = rolling_zscore_df(
-			df, col="value", window_size=3, with_median="rolling_med"
-		)
-
-		assert "rolling_med" in result.columns
+		assert positional.equals(keyword)  # type: ignore
 
-	def test_with_mad_output(self) -> None:
-		"""Test including MAD in output."""
-		df = pl.DataFrame({"value": [1.0, 2.0, 3.0, 4.0, 5.0]})
+	def test_zero_mad_replaced_with_fill_value(self) -> None:
+		"""Test that a zero rolling MAD is replaced with fill_value."""
+		df = pl.DataFrame({"value": [5.0, 5.0, 5.0, 5.0, 6.0]})
 
-		# Note: with_mad parameter doesn't rename the internal 'mad' column,
-		# it just includes the 'mad' column in output
-		result = rolling_zscore_df(df, col="value", window_size=3, with_mad="mad")
+		result = rolling_zscore_df(
+			df, col="value", window_size=3, fill_value=0.5, with_mad="mad"
+		)
 
-		assert "mad" in result.columns
+		assert result.get_column("mad").to_list() == [0.5, 0.5, 0.5, 0.5, 0.5]  # type: ignore
+		assert result.get_column("z_score")[4] == (6.0 - 5.0) / (0.5 * 1.4826 + 1e-8)  # type: ignore
 
-	def test_min_samples(self) -> None:
+	def test_min_samples(self, linear_df: pl.DataFrame) -> None:
 		"""Test min_samples parameter."""
-		df = pl.DataFrame({"value": [1.0, 2.0, 3.0, 4.0, 5.0]})
-
-		result = rolling_zscore_df(df, col="value", window_size=5, min_samples=1)
+		null_count = (
+			rolling_zscore_df(
+				linear_df.lazy(), col="value", window_size=5, min_samples=1
+			)
+			.select(pl.col("z_score").null_count())
+			.collect()
+			.item()
+		)
 
 		# With min_samples=1, we should get z-scores even at the beginning
-		assert result["z_score"].null_count() < 5  # type: ignore
+		assert null_count < 5
 
 	def test_centered_window(self) -> None:
 		"""Test centered window option."""
-		df = pl.DataFrame({"value": [1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0]})
+		df = pl.DataFrame({"value": np.arange(1.0, 8.0)})
 
 		result_centered = rolling_zscore_df(df, col="value", window_size=3, center=True)
 		result_not_centered = rolling_zscore_df(
@@ -382,71 +427,86 @@ class TestRollingZscoreDf:
 		)
 
 		# Results should be different with different centering
-		assert (
-			result_centered["z_score"].to_list()  # type: ignore
-			!= result_not_centered["z_score"].to_list()  # type: ignore
-		)
+		centered = result_centered.get_column("z_score")  # type: ignore
+		not_centered = result_not_centered.get_column("z_score")  # type: ignore
+		assert not centered.equals(not_centered)  # type: ignore
 
 	def test_zscore_for_median_value_near_zero(self) -> None:
 		"""Test that z-score for values at median is near zero."""
 		# Create data where median is clearly 5.0
-		df = pl.DataFrame({"value": [1.0, 3.0, 5.0, 7.0, 9.0, 5.0, 5.0, 5.0, 5.0, 5.0]})
+		df = pl.from_numpy(_MEDIAN_FIVE, schema=["value"])
 
-		result = rolling_zscore_df(df, col="value", window_size=5, min_samples=1)
+		result = rolling_zscore_df(
+			df, col="value", window_size=5, min_samples=1, with_median="rolling_med"
+		)
 
+		np.testing.assert_allclose(
+			result.get_column("rolling_med").to_numpy(allow_copy=False),  # type: ignore
+			_EXPECTED_ROLLING_MEDIAN,
+			atol=1e-12,
+		)
 		# Later values at median (5.0) should have z-score near 0
-		zscores = result["z_score"].to_list()  # type: ignore
-		# Get a non-null z-score for a value that equals the rolling median
-		non_null_zscores = [z for z in zscores if z is not None]  # type: ignore
-		assert len(non_null_zscores) > 0  # type: ignore
+		zscores = result.get_column("z_score").to_numpy()  # type: ignore
+		assert np.isfinite(zscores).sum() > 0
+		assert abs(zscores[-1]) < 0.01
 
 	def test_outlier_has_high_zscore(self) -> None:
 		"""Test that outliers have high z-scores."""
-		df = pl.DataFrame(
-			{"value": [1.0, 2.0, 3.0, 4.0, 5.0, 100.0, 7.0, 8.0, 9.0, 10.0]}
-		)
+		values = _LINEAR.copy()
+		values[5] = 100.0
+		df = pl.from_numpy(values, schema=["value"])
 
 		result = rolling_zscore_df(df, col="value", window_size=5)
 
 		# The outlier (100.0 at index 5) should have a high z-score
 		# Check values after the outlier where window includes it
-		zscores = result["z_score"].to_list()  # type: ignore
-		# Find max absolute z-score
-		max_zscore = max(abs(z) for z in zscores if z is not None)  # type: ignore
-		assert max_zscore > 2.0
-
-	def test_lazyframe_support(self) -> None:
-		"""Test that LazyFrame input returns LazyFrame output."""
-		lf = pl.DataFrame({"value": [1.0, 2.0, 3.0, 4.0, 5.0]}).lazy()
+		zscores = result.get_column("z_score").to_numpy()  # type: ignore
+		assert np.nanmax(np.abs(zscores)) > 2.0
+
+	@pytest.mark.parametrize(
+		("lazy", "expected_type"),
+		[(False, pl.DataFrame), (True, pl.LazyFrame)],
+		ids=["dataframe", "lazyframe"],
+	)
+	def test_frame_type_dispatch(
+		self,
+		linear_df: pl.DataFrame,
+		lazy: bool,
+		expected_type: type[pl.DataFrame | pl.LazyFrame],
+	) -> None:
+		"""Test that the output frame type matches the input frame type."""
+		df = linear_df.lazy() if lazy else linear_df
 
-		result = rolling_zscore_df(lf, col="value", window_size=3)
+		result = rolling_zscore_df(df, col="value", window_size=3)
 
-		assert isinstance(result, pl.LazyFrame)
+		assert isinstance(result, expected_type)
 
-	def test_dataframe_support(self) -> None:
-		"""Test that DataFrame input returns DataFrame output."""
-		df = pl.DataFrame({"value": [1.0, 2.0, 3.0, 4.0, 5.0]})
+	def test_streaming_engine_matches_in_memory(self) -> None:
+		"""Test that the streaming engine gives the same result as in-memory."""
+		lf = pl.from_numpy(_LINEAR, schema=["value"]).lazy()
 
-		result = rolling_zscore_df(df, col="value", window_size=3)
+		result = rolling_zscore_df(
+			lf, col="value", window_size=3, with_median="med", with_mad="mad"
+		)
 
-		assert isinstance(result, pl.DataFrame)
+		# Small chunks so the rolling windows span chunk boundaries
+		with pl.Config(streaming_chunk_size=2):
+			streamed = result.collect(engine="streaming")  # type: ignore
+		assert streamed.height == 10
+		assert streamed.equals(result.collect())  # type: ignore
 
 	def test_zero_threshold_handling(self) -> None:
 		"""Test that zero MAD is handled with fill_value."""
 		# All same values = zero MAD
-		df = pl.DataFrame({"value": [5.0, 5.0, 5.0, 5.0, 5.0]})
+		df = pl.DataFrame({"value": np.full(5, 5.0)})
 
 		result = rolling_zscore_df(
 			df, col="value", window_size=3, zero_threshold=1e-5, fill_value=1e-4
 		)
 
 		# Should not have inf or nan due to division by zero
-		zscores = result["z_score"].to_list()  # type: ignore
-		for z in zscores:  # type: ignore
-			if z is not None:
-				assert z != float("inf")
-				assert z != float("-inf")
-				assert z == z  # not NaN
+		z = pl.col("z_score")
+		assert result.select((z.is_infinite() | z.is_nan()).any()).item() is False  # type: ignore
 
 	def test_custom_zero_threshold(self) -> None:
 		"""Test custom zero_threshold parameter."""
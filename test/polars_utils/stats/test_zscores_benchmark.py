@@ -0,0 +1,43 @@
+from typing import TYPE_CHECKING
+
+import numpy as np
+import polars as pl
+import pytest
+
+from polars_timeseries_utils.stats.zscore import rolling_zscore_df
+
+pytest.importorskip("pytest_benchmark")
+
+if TYPE_CHECKING:
+	from pytest_benchmark.fixture import BenchmarkFixture  # type: ignore
+
+_N_ROWS = 10**6
+# Generous ceiling: catches an O(n * window) rolling kernel, not machine noise
+_MAX_MEAN_SECONDS = 5.0
+
+
+@pytest.fixture(scope="module")
+def large_df() -> pl.DataFrame:
+	"""DataFrame with a million standard normal values."""
+	return pl.from_numpy(
+		np.random.default_rng(0).standard_normal(_N_ROWS), schema=["value"]
+	)
+
+
+@pytest.mark.benchmark(group="rolling_zscore")
+@pytest.mark.parametrize("window_size", [16, 256, 1024])
+def test_rolling_zscore_df_large(
+	benchmark: "BenchmarkFixture",
+	large_df: pl.DataFrame,
+	window_size: int,
+) -> None:
+	"""Benchmark rolling_zscore_df on a million rows across window sizes."""
+	result = benchmark.pedantic(  # type: ignore
+		rolling_zscore_df,
+		args=(large_df,),
+		kwargs={"col": "value", "window_size": window_size},
+		rounds=3,
+	)
+
+	assert result.height == _N_ROWS  # type: ignore
+	assert benchmark.stats.stats.mean < _MAX_MEAN_SECONDS  # type: ignore